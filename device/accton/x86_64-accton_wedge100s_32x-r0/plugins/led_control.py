@@ -71,11 +71,18 @@ _IFACE_TO_LED_PORT = {
 
 
 def _led_write(attr, val):
-    """Write LED value to /run/wedge100s/; daemon handles CPLD write-through."""
+    """Write LED value to /run/wedge100s/; daemon handles CPLD write-through.
+
+    Called on every link event, so this is a bare open/write/close; the
+    run directory is created once by LedControl.__init__.
+    """
     try:
-        os.makedirs(_RUN_DIR, exist_ok=True)
-        with open('{}/{}'.format(_RUN_DIR, attr), 'w') as f:
-            f.write('{}\n'.format(val))
+        fd = os.open('{}/{}'.format(_RUN_DIR, attr),
+                     os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, '{}\n'.format(val).encode())
+        finally:
+            os.close(fd)
     except Exception:
         pass
 
@@ -116,15 +123,30 @@ class LedControl(LedControlBase):
     """
 
     def __init__(self):
+        try:
+            os.makedirs(_RUN_DIR, exist_ok=True)
+        except OSError:
+            pass
         self._port_states = _state_db_port_states()
         _led_write('led_sys1', _LED_GREEN)
-        any_up = any(self._port_states.values())
-        _led_write('led_sys2', _LED_GREEN if any_up else _LED_OFF)
+        # Number of ports currently up; maintained on transitions so link
+        # events never have to scan _port_states.
+        self._up_count = sum(1 for up in self._port_states.values() if up)
+        self._last_sys2 = _LED_GREEN if self._up_count else _LED_OFF
+        _led_write('led_sys2', self._last_sys2)
 
     def port_link_state_change(self, port, state):
-        self._port_states[port] = (state == 'up')
-        any_up = any(self._port_states.values())
-        _led_write('led_sys2', _LED_GREEN if any_up else _LED_OFF)
+        new = (state == 'up')
+        if new != self._port_states.get(port, False):
+            self._up_count += 1 if new else -1
+        self._port_states[port] = new
+        any_up = self._up_count > 0
+        # SYS2 only changes on the first link-up / last link-down; skip the
+        # rewrite for every other event in a reconvergence burst.
+        desired = _LED_GREEN if any_up else _LED_OFF
+        if desired != self._last_sys2:
+            _led_write('led_sys2', desired)
+            self._last_sys2 = desired
         # Fast-path LEDUP1 DATA_RAM coordination: write a .set file so
         # wedge100s-ledup-linkstate picks up the change on its next poll
         # iteration rather than waiting up to POLL_INTERVAL_S.
@@ -34,8 +34,13 @@ Design notes
 ------------
 * SSH target uses IPv6 link-local with %usb0 zone ID.  subprocess.run passes
   this literally to ssh; OpenSSH handles the zone ID correctly on Linux.
-* Thread-safety: each SSH call spawns an independent subprocess; no shared
-  state, so no lock is needed for the SSH path.
+* Persistent session: SSH runs with ControlMaster=auto / ControlPersist, so
+  the first call opens a master connection (socket _SSH_CONTROL_PATH) and
+  later calls reuse it, skipping the TCP + key-exchange + auth handshake.
+  If the socket cannot be created ssh silently falls back to a direct
+  connection.
+* Thread-safety: each SSH call is an independent client subprocess; the
+  master multiplexes concurrent sessions, so no lock is needed.
 * TTY helpers are retained for provision_ssh_key() only.  They are NOT called
   from send_command() and therefore cannot cause runtime latency spikes.
 * _read_until() uses select() for timeouts; blocking I/O with VMIN=1 is
@@ -61,6 +66,22 @@ _CMD_TIMEOUT   = 5.0
 _LOGIN_TIMEOUT = 2.0
 _BUF_SIZE      = 1024
 
+# Raw 57600 8N1 termios settings for _tty_open(), built once.  Layout is
+# [iflag, oflag, cflag, lflag, ispeed, ospeed, cc]; with lflag = 0 only
+# VMIN/VTIME of cc matter.
+_TTY_CC = [b'\x00'] * termios.NCCS
+_TTY_CC[termios.VMIN]  = 1
+_TTY_CC[termios.VTIME] = 0
+_TTY_ATTR = [
+    termios.IGNPAR,
+    0,
+    termios.B57600 | termios.CS8 | termios.CLOCAL | termios.CREAD,
+    0,
+    termios.B57600,
+    termios.B57600,
+    _TTY_CC,
+]
+
 # Serialises TTY access within a single Python process (provision_ssh_key only).
 _lock = threading.Lock()
 
@@ -72,6 +93,8 @@ _lock = threading.Lock()
 _BMC_SSH_TARGET = 'root@fe80::ff:fe00:1%usb0'
 _SSH_TIMEOUT    = 5.0
 _SSH_KEY        = '/etc/sonic/wedge100s-bmc-key'
+_SSH_CONTROL_PATH    = '/run/wedge100s/bmc-ssh.ctl'
+_SSH_CONTROL_PERSIST = 300   # seconds an idle master connection is kept
 
 
 # ---------------------------------------------------------------------------
@@ -89,16 +112,7 @@ def _tty_open():
     for _ in range(20):
         try:
             fd = os.open(_TTY_DEVICE, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
-            attr = termios.tcgetattr(fd)
-            attr[0] = termios.IGNPAR
-            attr[1] = 0
-            attr[2] = termios.B57600 | termios.CS8 | termios.CLOCAL | termios.CREAD
-            attr[3] = 0
-            attr[6][termios.VMIN]  = 1
-            attr[6][termios.VTIME] = 0
-            attr[4] = termios.B57600
-            attr[5] = termios.B57600
-            termios.tcsetattr(fd, termios.TCSANOW, attr)
+            termios.tcsetattr(fd, termios.TCSANOW, _TTY_ATTR)
             flags = fcntl.fcntl(fd, fcntl.F_GETFL)
             fcntl.fcntl(fd, fcntl.F_SETFL, flags & ~os.O_NONBLOCK)
             return fd
@@ -125,21 +139,19 @@ def _drain(fd, settle=0.05):
 
     Args:
         fd: TTY file descriptor.
-        settle: Idle time in seconds after which the drain completes.
+        settle: Idle time in seconds after which the drain completes.  At
+            57600 baud the BMC pauses between output bursts, so a shorter
+            window can return early and leave a stale prompt behind.
     """
-    last_read = time.time()
     while True:
-        elapsed = time.time() - last_read
-        if elapsed >= settle:
+        r, _, _ = select.select([fd], [], [], settle)
+        if not r:
             break
-        remaining = settle - elapsed
-        r, _, _ = select.select([fd], [], [], min(remaining, 0.05))
-        if r:
-            try:
-                os.read(fd, _BUF_SIZE)
-                last_read = time.time()
-            except OSError:
+        try:
+            if not os.read(fd, _BUF_SIZE):
                 break
+        except OSError:
+            break
 
 
 def _read_until(fd, needle, timeout):
@@ -153,7 +165,7 @@ def _read_until(fd, needle, timeout):
     Returns:
         bytes: All data read (may or may not contain needle).
     """
-    buf = b''
+    buf = bytearray()
     deadline = time.time() + timeout
     while time.time() < deadline:
         remaining = deadline - time.time()
@@ -163,12 +175,13 @@ def _read_until(fd, needle, timeout):
                 chunk = os.read(fd, _BUF_SIZE)
                 if not chunk:
                     break
-                buf += chunk
+                buf.extend(chunk)
             except OSError:
                 break
-        if needle in buf:
-            break
-    return buf
+            # Only rescan when new bytes arrived.
+            if needle in buf:
+                break
+    return bytes(buf)
 
 
 def _tty_login(fd):
@@ -207,22 +220,33 @@ def _tty_send_raw(cmd):
     """
     cmd_bytes = cmd.encode('ascii') + b'\r\n\x00'
     with _lock:
-        for _ in range(1, _TTY_RETRY + 1):
-            fd = _tty_open()
-            if fd < 0:
-                continue
-            try:
-                if not _tty_login(fd):
-                    continue
-                _drain(fd)
-                os.write(fd, cmd_bytes)
-                buf = _read_until(fd, _TTY_PROMPT, _CMD_TIMEOUT)
-                if _TTY_PROMPT in buf:
-                    return buf.decode('latin-1', errors='replace')
-            except OSError:
-                pass
-            finally:
-                _tty_close(fd)
+        # Open the TTY once and reuse it across retries.  Every attempt
+        # re-runs _tty_login() (CR plus prompt re-sync) and drains before
+        # sending, so a timed-out attempt's late output or a login prompt
+        # is not read back as this command's reply.  The session is torn
+        # down and reopened only on I/O error or a failed login.
+        fd = -1
+        try:
+            for _ in range(1, _TTY_RETRY + 1):
+                try:
+                    if fd < 0:
+                        fd = _tty_open()
+                        if fd < 0:
+                            continue
+                    if not _tty_login(fd):
+                        _tty_close(fd)
+                        fd = -1
+                        continue
+                    _drain(fd)
+                    os.write(fd, cmd_bytes)
+                    buf = _read_until(fd, _TTY_PROMPT, _CMD_TIMEOUT)
+                    if _TTY_PROMPT in buf:
+                        return buf.decode('latin-1', errors='replace')
+                except OSError:
+                    _tty_close(fd)
+                    fd = -1
+        finally:
+            _tty_close(fd)
     return None
 
 
@@ -234,6 +258,8 @@ def _ssh_send_command(cmd):
     """Send a shell command to the BMC via SSH over USB-CDC-Ethernet.
 
     Returns stdout as str on success, None on any error.
+    Reuses the persistent master connection at _SSH_CONTROL_PATH when one
+    is up; otherwise this call establishes it.
     Thread-safe: each call is an independent subprocess.
     """
     import subprocess
@@ -245,6 +271,9 @@ def _ssh_send_command(cmd):
                 '-o', 'StrictHostKeyChecking=no',
                 '-o', 'ConnectTimeout={:d}'.format(int(_SSH_TIMEOUT)),
                 '-o', 'BatchMode=yes',
+                '-o', 'ControlMaster=auto',
+                '-o', 'ControlPath=' + _SSH_CONTROL_PATH,
+                '-o', 'ControlPersist={:d}'.format(_SSH_CONTROL_PERSIST),
                 _BMC_SSH_TARGET,
                 cmd,
             ],
@@ -10,7 +10,10 @@ Subsystem population schedule:
   Phase 7: System EEPROM
 """
 
+import ctypes
 import os
+import select
+import struct
 import time
 
 try:
@@ -23,9 +26,17 @@ from sonic_platform.thermal import Thermal, NUM_THERMALS
 from sonic_platform.fan import FanDrawer, NUM_FANS
 from sonic_platform.psu import Psu, NUM_PSUS
 from sonic_platform.sfp import Sfp, NUM_SFPS
+from sonic_platform.sfp import _PRESENT_MASK, _PRESENT_PATHS, _read_presence_mask
 from sonic_platform.eeprom import SysEeprom
 from sonic_platform.watchdog import Watchdog
 
+# inotify(7) constants used to wait for the daemon's presence bitmap update.
+_IN_CLOSE_WRITE = 0x00000008
+_IN_IGNORED     = 0x00008000
+_IN_NONBLOCK    = os.O_NONBLOCK
+_IN_CLOEXEC     = os.O_CLOEXEC
+_INOTIFY_EVENT  = struct.Struct('iIII')   # wd, mask, cookie, len
+
 
 class Chassis(ChassisBase):
     """Platform-specific Chassis class for Accton Wedge 100S-32X."""
@@ -41,6 +52,10 @@ class Chassis(ChassisBase):
         The SFP list has a None sentinel at index 0 so that get_sfp(N)
         returns Sfp(N-1) — matching the 1-based port_config.ini index column
         used by xcvrd.
+
+        Enumeration is deliberately sequential: every subsystem constructor
+        only records its index and touches no hardware or daemon files, so
+        there is no I/O latency for a thread pool to overlap.
         """
         ChassisBase.__init__(self)
         for i in range(NUM_THERMALS):
@@ -63,8 +78,11 @@ class Chassis(ChassisBase):
         # Firmware components: CPLD + BIOS
         from sonic_platform.component import COMPONENT_LIST
         self._component_list = list(COMPONENT_LIST)
-        # Previous presence state for get_change_event() polling
-        self._prev_presence = {}
+        # Previous 32-port presence bitmap for get_change_event() polling
+        # (bit N = port N; None until the first poll reports every port)
+        self._prev_mask = None
+        # inotify fd watching sfp_present_mask (-1 = not armed)
+        self._presence_wd_fd = -1
 
     # ------------------------------------------------------------------
     # Status LED  (SYS1 — system-status indicator on CPLD reg 0x3e)
@@ -171,30 +189,38 @@ class Chassis(ChassisBase):
         """
         Read all 32 port presence bits from wedge100s-i2c-daemon cache files.
 
-        Reads /run/wedge100s/sfp_N_present for each port.  Ports whose file
-        is absent (daemon not yet started — normal for the first few seconds
-        after pmon start) are reported as not present.
+        Prefers /run/wedge100s/sfp_present_mask (one "0x%08x" bitmap written
+        by the daemon after each PCA9535 scan, bit N = port N) so a poll is a
+        single file read.  Falls back to the per-port sfp_N_present files if
+        the mask is absent or mid-rewrite.  Ports whose file is absent (daemon
+        not yet started — normal for the first few seconds after pmon start)
+        are reported as not present.
 
-        Returns dict {port (0-based): bool present}.
+        Returns int bitmap, bit N set = port N (0-based) present.
         """
-        result = {}
+        mask = _read_presence_mask()
+        if mask is not None:
+            return mask
+
+        mask = 0
         for port in range(NUM_SFPS):
-            cache = '/run/wedge100s/sfp_{}_present'.format(port)
+            cache = _PRESENT_PATHS[port]
             try:
                 with open(cache) as f:
-                    result[port] = f.read().strip() == '1'
+                    if f.read().strip() == '1':
+                        mask |= 1 << port
             except OSError:
-                result[port] = False
-        return result
+                pass
+        return mask
 
     def get_change_event(self, timeout=0):
         """
         Poll all QSFP ports for presence changes via daemon cache files.
 
-        Reads /run/wedge100s/sfp_N_present for all 32 ports; no I2C access.
-        xcvrd calls this with timeout in milliseconds.  We sleep 1 second
-        between polls, which is appropriate since module insertion/removal
-        is a human-scale event.
+        Reads the daemon presence bitmap for all 32 ports; no I2C access.
+        xcvrd calls this with timeout in milliseconds.  Between polls we
+        block on an inotify watch of the bitmap file (at most 3 s), so a
+        change is reported as soon as the daemon publishes it.
 
         Returns:
             (True, {'sfp': {port_idx: '1'|'0', ...}})
@@ -203,23 +229,85 @@ class Chassis(ChassisBase):
         expiry = time.monotonic() + (timeout / 1000.0 if timeout else 0)
 
         while True:
-            presence = self._bulk_read_presence()
+            mask = self._bulk_read_presence()
+            if self._prev_mask is None:
+                changed = (1 << NUM_SFPS) - 1
+            else:
+                changed = mask ^ self._prev_mask
+            self._prev_mask = mask
+
             events = {}
-            if presence is not None:
-                for port, present in presence.items():
-                    idx = port + 1              # convert to 1-based xcvrd index
-                    prev = self._prev_presence.get(idx)
-                    if prev != present:
-                        events[str(idx)] = '1' if present else '0'
-                        self._prev_presence[idx] = present
+            port = 0
+            while changed:
+                if changed & 1:
+                    # 1-based xcvrd index
+                    events[str(port + 1)] = '1' if (mask >> port) & 1 else '0'
+                changed >>= 1
+                port += 1
 
             if events:
                 return True, {'sfp': events}
 
-            if not timeout or time.monotonic() >= expiry:
+            now = time.monotonic()
+            if not timeout or now >= expiry:
                 return True, {'sfp': {}}
 
-            time.sleep(3.0)   # daemon polls every 3 s; no point polling faster
+            # Daemon rescans every 3 s; no point polling faster than that.
+            self._wait_presence_update(min(3.0, expiry - now))
+
+    def _arm_presence_watch(self):
+        """Return an inotify fd that fires when sfp_present_mask is rewritten.
+
+        Returns -1 if inotify is unavailable or the mask file does not exist
+        yet (daemon not started); the caller then falls back to sleeping and
+        the watch is retried on the next wait.
+        """
+        if self._presence_wd_fd >= 0:
+            return self._presence_wd_fd
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+            if fd < 0:
+                return -1
+            if libc.inotify_add_watch(fd, _PRESENT_MASK.encode(),
+                                      _IN_CLOSE_WRITE) < 0:
+                os.close(fd)
+                return -1
+        except (OSError, AttributeError):
+            return -1
+        self._presence_wd_fd = fd
+        return fd
+
+    def _wait_presence_update(self, max_wait):
+        """Block until the daemon rewrites the presence bitmap or max_wait expires.
+
+        Edge-triggered on IN_CLOSE_WRITE of sfp_present_mask so a change is
+        picked up as soon as the daemon publishes it rather than on the next
+        blind sleep boundary.  Falls back to time.sleep() without inotify.
+
+        Args:
+            max_wait: Upper bound on the wait, in seconds.
+        """
+        fd = self._arm_presence_watch()
+        if fd < 0:
+            time.sleep(max_wait)
+            return
+        r, _, _ = select.select([fd], [], [], max_wait)
+        if not r:
+            return
+        try:
+            buf = os.read(fd, 4096)
+        except OSError:
+            return
+        # IN_IGNORED: the watched file was removed; re-arm on the next wait.
+        off = 0
+        while off + _INOTIFY_EVENT.size <= len(buf):
+            _, mask, _, name_len = _INOTIFY_EVENT.unpack_from(buf, off)
+            if mask & _IN_IGNORED:
+                os.close(fd)
+                self._presence_wd_fd = -1
+                break
+            off += _INOTIFY_EVENT.size + name_len
 
     def get_serial(self):
         """Return serial number from EEPROM TLV 0x23."""
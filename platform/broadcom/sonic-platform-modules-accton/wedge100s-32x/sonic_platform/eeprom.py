@@ -14,17 +14,74 @@ boot.  This is the only read path; there is no sysfs fallback.  The daemon
 serialises all CP2112 access, eliminating the mux-contention issue (shared
 PCA9548 0x74 between EEPROM ch6 and PCA9535 presence chips ch2/3) that
 caused address corruption and zeroed-data before the daemon architecture.
+
+The decoded TLV dictionary is persisted to /run/wedge100s/syseeprom_tlv.json
+so that later processes (decode-syseeprom, pmon daemon restarts) skip the
+read and decode.  The persisted copy is tied to the raw cache file's mtime
+and size and is ignored when either changes.
 """
 
+import json
+import os
+import struct
+
 try:
     from sonic_platform_base.sonic_eeprom import eeprom_tlvinfo
 except ImportError as e:
     raise ImportError(str(e) + " - required module not found")
 
 _SYSEEPROM_DAEMON_CACHE = '/run/wedge100s/syseeprom'
+_SYSEEPROM_TLV_CACHE    = '/run/wedge100s/syseeprom_tlv.json'
 _ONIE_MAGIC             = b'TlvInfo\x00'
 
 
+def _raw_cache_stamp():
+    """Return (mtime_ns, size) of the raw daemon cache, or None if absent."""
+    try:
+        st = os.stat(_SYSEEPROM_DAEMON_CACHE)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _load_tlv_cache(stamp):
+    """Return the persisted TLV dict if it was decoded from the same raw file.
+
+    Args:
+        stamp: (mtime_ns, size) tuple from _raw_cache_stamp().
+
+    Returns:
+        dict: Decoded TLV entries, or None if absent, stale, or unreadable.
+    """
+    try:
+        with open(_SYSEEPROM_TLV_CACHE) as f:
+            saved = json.load(f)
+        if saved.get('stamp') == list(stamp) and saved.get('tlv'):
+            return saved['tlv']
+    except (OSError, ValueError, AttributeError):
+        pass
+    return None
+
+
+def _store_tlv_cache(stamp, result):
+    """Atomically persist the decoded TLV dict; failures are ignored.
+
+    The temp name carries the pid: several pmon daemons and CLI tools
+    may decode the EEPROM at the same time, and a shared name would let
+    one process rename another's half-written file into place.
+    """
+    tmp = '{}.{}.tmp'.format(_SYSEEPROM_TLV_CACHE, os.getpid())
+    try:
+        with open(tmp, 'w') as f:
+            json.dump({'stamp': list(stamp), 'tlv': result}, f)
+        os.replace(tmp, _SYSEEPROM_TLV_CACHE)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
 class SysEeprom(eeprom_tlvinfo.TlvInfoDecoder):
     """System EEPROM reader for Accton Wedge 100S-32X.
 
@@ -43,14 +100,21 @@ class SysEeprom(eeprom_tlvinfo.TlvInfoDecoder):
     def read_eeprom(self):
         """Return raw EEPROM bytes from the daemon cache.
 
+        Only the TlvInfo header is read first; the TLV area is read only
+        when the magic matches, and only as far as its declared length.
+
         Returns:
             bytearray: Raw EEPROM data (up to 8192 bytes), or None if absent.
         """
+        hdr_len = self._TLV_INFO_HDR_LEN
         try:
             with open(_SYSEEPROM_DAEMON_CACHE, 'rb') as f:
-                data = f.read(8192)
-            if len(data) >= 8 and data[:8] == _ONIE_MAGIC:
-                return bytearray(data)
+                hdr = f.read(hdr_len)
+                if len(hdr) < hdr_len or hdr[:8] != _ONIE_MAGIC:
+                    return None
+                (total_length,) = struct.unpack_from('>H', hdr, 9)
+                body = f.read(min(total_length, 8192 - hdr_len))
+            return bytearray(hdr + body)
         except OSError:
             pass
         return None
@@ -60,7 +124,8 @@ class SysEeprom(eeprom_tlvinfo.TlvInfoDecoder):
 
         Returns {} without caching when the daemon file is absent (normal for
         the first few seconds after boot) so the next call retries.  Once a
-        valid parse succeeds the result is cached permanently (EEPROM is static).
+        valid parse succeeds the result is cached permanently (EEPROM is static)
+        and persisted to _SYSEEPROM_TLV_CACHE for other processes.
 
         Returns:
             dict: TLV entries keyed by hex type-code string (e.g. "0x21"
@@ -69,6 +134,14 @@ class SysEeprom(eeprom_tlvinfo.TlvInfoDecoder):
         if self._eeprom_cache is not None:
             return self._eeprom_cache
 
+        stamp = _raw_cache_stamp()
+        if stamp is None or stamp[1] < self._TLV_INFO_HDR_LEN:
+            return {}
+        persisted = _load_tlv_cache(stamp)
+        if persisted is not None:
+            self._eeprom_cache = persisted
+            return persisted
+
         try:
             raw = self.read_eeprom()
         except Exception:
@@ -78,25 +151,30 @@ class SysEeprom(eeprom_tlvinfo.TlvInfoDecoder):
         if raw is None or len(raw) < self._TLV_INFO_HDR_LEN + 2:
             return {}
 
-        total_length = (raw[9] << 8) | raw[10]
+        # memoryview slices are zero-copy; only the TLV handed to decoder()
+        # is materialised.
+        mv = memoryview(raw)
+        raw_len = len(mv)
+        (total_length,) = struct.unpack_from('>H', mv, 9)
         idx = self._TLV_INFO_HDR_LEN
         end = idx + total_length
         result = {}
 
-        while (idx + 2) <= len(raw) and idx < end:
-            if not self.is_valid_tlv(raw[idx:]):
+        while (idx + 2) <= raw_len and idx < end:
+            tlv_code, tlv_len = struct.unpack_from('>BB', mv, idx)
+            # Inlined is_valid_tlv(): the TLV body must fit in the buffer.
+            if idx + 2 + tlv_len > raw_len:
                 break
-            tlv_len = raw[idx + 1]
-            tlv = raw[idx:idx + 2 + tlv_len]
-            code = "0x{:02X}".format(raw[idx])
+            tlv = bytearray(mv[idx:idx + 2 + tlv_len])
             _, value = self.decoder(None, tlv)
-            result[code] = value
-            if raw[idx] == self._TLV_CODE_CRC_32:
+            result["0x{:02X}".format(tlv_code)] = value
+            if tlv_code == self._TLV_CODE_CRC_32:
                 break
             idx += 2 + tlv_len
 
         if result:
             self._eeprom_cache = result  # cache only on successful parse
+            _store_tlv_cache(stamp, result)
         return result
 
     def system_eeprom_info(self):
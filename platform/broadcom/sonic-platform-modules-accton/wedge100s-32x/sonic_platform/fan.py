@@ -26,11 +26,12 @@ Speed is reported as min(front_rpm, rear_rpm) per ONL fani.c policy.
 Direction is F2B = FAN_DIRECTION_INTAKE (fixed, per ONL fani.c).
 Speed control: 'set_fan_speed.sh <pct>' on the BMC affects all trays.
 
-Caching: fantray_present and per-tray RPM pairs are cached for _CACHE_TTL
-seconds to avoid redundant BMC calls when thermalctld reads multiple
+Caching: fantray_present and a snapshot of all 10 rotor RPMs are cached for
+_CACHE_TTL seconds to avoid redundant BMC calls when thermalctld reads multiple
 attributes of the same fan in a single poll pass.
 """
 
+import os
 import time
 
 try:
@@ -59,27 +60,49 @@ NUM_FANS       = 5       # 5 fan trays
 # ---------------------------------------------------------------------------
 
 # Target speed tracks the last value passed to set_speed().  All 5 trays
-# are controlled by a single set_fan_speed.sh call so one variable suffices.
+# are controlled by a single set_fan_speed.sh call so one slot suffices; it
+# is a 1-element list so set_speed() can replace it without 'global'.
 # None means thermalctld has not yet issued a set_speed(); get_target_speed()
 # raises NotImplementedError when None so that thermalctld's try_get() returns
 # NOT_AVAILABLE and skips is_under/over_speed checks (avoids false "Not OK"
 # alarms before the first explicit speed command).
-_target_speed_pct = None
+_target_speed_pct = [None]
 
 # Short-lived cache so that multiple attribute reads in one thermalctld pass
 # hit the BMC only once per unique sysfs path.
 _CACHE_TTL = 2.0   # seconds
 
 _fantray_cache = {'ts': 0.0, 'val': None}   # fantray_present bitmask
-_rpm_cache     = {}                           # {fan_index: {'ts', 'front', 'rear'}}
+# RPMs for all trays, refreshed together: vals[2*(i-1)] / vals[2*(i-1)+1]
+# are the front / rear rotor of tray i.
+_rpm_snapshot  = {'ts': 0.0, 'vals': [None] * (2 * NUM_FANS)}
+_RPM_PATHS     = tuple(
+    '{}/fan_{}_{}'.format(_RUN_DIR, i, side)
+    for i in range(1, NUM_FANS + 1) for side in ('front', 'rear'))
+
+
+# Open fds on the daemon output files, keyed by path.  wedge100s-bmc-daemon
+# rewrites each file in place (fopen "w"), so the inode stays the same and a
+# pread() at offset 0 sees the latest value without an open/close per read.
+_fd_cache = {}
 
 
 def _daemon_read_int(path):
     """Read a plain decimal integer from a bmc-poller daemon output file."""
+    fd = _fd_cache.get(path)
     try:
-        with open(path) as f:
-            return int(f.read().strip())
-    except (IOError, OSError, ValueError):
+        if fd is None:
+            fd = os.open(path, os.O_RDONLY)
+            _fd_cache[path] = fd
+        return int(os.pread(fd, 16, 0))
+    except (OSError, ValueError):
+        # Drop the fd so a recreated file is picked up on the next read.
+        if fd is not None:
+            _fd_cache.pop(path, None)
+            try:
+                os.close(fd)
+            except OSError:
+                pass
         return None
 
 
@@ -99,21 +122,17 @@ def _cached_fantray_present():
     return val
 
 
-def _cached_rpm_pair(fan_index):
+def _refresh_all_rpms():
     """
-    Return (front_rpm, rear_rpm) for fan tray fan_index (1-based).
-    Each pair is cached for _CACHE_TTL seconds.
-    Returns (None, None) when the daemon files are unreadable.
+    Return the list of all 10 rotor RPMs, re-reading every daemon file
+    once the snapshot is older than _CACHE_TTL.  thermalctld walks all 5
+    trays in one pass, so one refresh serves the whole pass.
     """
-    now   = time.monotonic()
-    entry = _rpm_cache.get(fan_index)
-    if entry and now - entry['ts'] < _CACHE_TTL:
-        return entry['front'], entry['rear']
-
-    front = _daemon_read_int('{}/fan_{}_front'.format(_RUN_DIR, fan_index))
-    rear  = _daemon_read_int('{}/fan_{}_rear'.format(_RUN_DIR, fan_index))
-    _rpm_cache[fan_index] = {'ts': now, 'front': front, 'rear': rear}
-    return front, rear
+    now = time.monotonic()
+    if now - _rpm_snapshot['ts'] >= _CACHE_TTL:
+        _rpm_snapshot['vals'] = [_daemon_read_int(p) for p in _RPM_PATHS]
+        _rpm_snapshot['ts'] = now
+    return _rpm_snapshot['vals']
 
 
 # ---------------------------------------------------------------------------
@@ -131,6 +150,8 @@ class Fan(FanBase):
         """
         FanBase.__init__(self)
         self.index = fan_index   # 1-based, 1–5
+        self._present_mask = 1 << (fan_index - 1)
+        self._rpm_slot     = 2 * (fan_index - 1)   # front rotor in _rpm_snapshot
 
     # ------------------------------------------------------------------
     # DeviceBase API
@@ -157,7 +178,7 @@ class Fan(FanBase):
         bitmask = _cached_fantray_present()
         if bitmask is None:
             return False
-        return not bool(bitmask & (1 << (self.index - 1)))
+        return not bitmask & self._present_mask
 
     def get_status(self):
         """True when the tray is present and at least one rotor is spinning."""
@@ -191,7 +212,8 @@ class Fan(FanBase):
         rpm = self.get_speed_rpm()
         if not rpm:
             return 0
-        return min((rpm * 100) // _MAX_FAN_SPEED, 100)
+        pct = (rpm * 100) // _MAX_FAN_SPEED
+        return pct if pct < 100 else 100
 
     def get_speed_rpm(self):
         """Return current fan speed in RPM.
@@ -201,11 +223,14 @@ class Fan(FanBase):
         Returns:
             int: RPM value, 0 if stalled, or None if BMC is unreadable.
         """
-        front, rear = _cached_rpm_pair(self.index)
-        if front is None and rear is None:
-            return None
-        available = [v for v in (front, rear) if v is not None]
-        return min(available)
+        vals  = _refresh_all_rpms()
+        front = vals[self._rpm_slot]
+        rear  = vals[self._rpm_slot + 1]
+        if front is None:
+            return rear
+        if rear is None:
+            return front
+        return front if front < rear else rear
 
     def get_target_speed(self):
         """Return the target fan speed as a percentage of maximum.
@@ -217,9 +242,10 @@ class Fan(FanBase):
         Returns:
             int: Target speed percentage (0–100).
         """
-        if _target_speed_pct is None:
+        target = _target_speed_pct[0]
+        if target is None:
             return self.get_speed()
-        return _target_speed_pct
+        return target
 
     def get_speed_tolerance(self):
         """
@@ -239,13 +265,12 @@ class Fan(FanBase):
         Returns:
             bool: True on success, False on failure.
         """
-        global _target_speed_pct
         speed = max(0, min(100, int(speed)))
         result = bmc.send_command('set_fan_speed.sh {}'.format(speed))
         if result is not None:
-            _target_speed_pct = speed
+            _target_speed_pct[0] = speed
             # Invalidate RPM cache so next read reflects the new speed.
-            _rpm_cache.clear()
+            _rpm_snapshot['ts'] = 0.0
             return True
         return False
 
@@ -37,6 +37,7 @@ Hardware notes (hare-lorax, 2026-02-25):
   - PSU1 had no AC power in the lab (pgood bit 1 = 0); PSU2 is live.
 """
 
+import os
 import time
 
 try:
@@ -56,6 +57,12 @@ _RUN_DIR = '/run/wedge100s'
 _CACHE_TTL  = 30.0
 _psu_cache  = [{} for _ in range(2)]   # one dict per PSU (0-indexed)
 
+# CPLD attribute cache: get_status() reads present + pgood, and psud asks
+# for presence/status of both PSUs back-to-back in one pass.  A short TTL
+# lets a single file read serve every query in that pass.
+_CPLD_CACHE_TTL = 0.2
+_cpld_cache     = {}                   # attr name -> (ts, value)
+
 _PSU_ALARM_CACHE    = '/run/wedge100s/psu{}_alarm'
 _PSU_INPUT_OK_CACHE = '/run/wedge100s/psu{}_input_ok'
 _PSU_MODEL_CACHE    = '/run/wedge100s/psu_{}_model'
@@ -63,6 +70,14 @@ _PSU_SERIAL_CACHE   = '/run/wedge100s/psu_{}_serial'
 
 NUM_PSUS = 2
 
+# Telemetry file paths per PSU (0-indexed), formatted once:
+# _PSU_TELEMETRY_PATHS[idx][key] -> /run/wedge100s/psu_{idx+1}_{key}
+_LINEAR11_KEYS = ('vin', 'iin', 'iout', 'pout', 'temp')
+_PSU_TELEMETRY_PATHS = tuple(
+    {key: '{}/psu_{}_{}'.format(_RUN_DIR, n, key)
+     for key in _LINEAR11_KEYS + ('vout', 'fan')}
+    for n in range(1, NUM_PSUS + 1))
+
 
 # ---------------------------------------------------------------------------
 # PMBus LINEAR11 decoder
@@ -97,21 +112,44 @@ def _pmbus_decode_linear11(raw):
 # Hardware access helpers
 # ---------------------------------------------------------------------------
 
+def _read_file_int(path, base=10):
+    """Parse a small integer file straight from its bytes.
+
+    int() accepts bytes and ignores surrounding whitespace, so there is no
+    need for a text-mode open, decode(), or strip().
+
+    Raises:
+        OSError, ValueError: On read or parse failure.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return int(os.read(fd, 32), base)
+    finally:
+        os.close(fd)
+
+
 def _read_cpld_attr(name):
-    """Read a CPLD integer attribute from the daemon cache (/run/wedge100s/)."""
+    """Read a CPLD integer attribute from the daemon cache (/run/wedge100s/).
+
+    Results are cached for _CPLD_CACHE_TTL seconds.
+    """
+    now = time.monotonic()
+    entry = _cpld_cache.get(name)
+    if entry is not None and now - entry[0] < _CPLD_CACHE_TTL:
+        return entry[1]
     try:
-        with open('{}/{}'.format(_RUN_DIR, name)) as f:
-            return int(f.read().strip(), 0)
+        val = _read_file_int('{}/{}'.format(_RUN_DIR, name), 0)
     except Exception:
-        return None
+        val = None
+    _cpld_cache[name] = (now, val)
+    return val
 
 
 def _read_daemon_int(path):
     """Read a plain decimal integer from a bmc-poller daemon output file."""
     try:
-        with open(path) as f:
-            return int(f.read().strip())
-    except (IOError, OSError, ValueError):
+        return _read_file_int(path)
+    except (OSError, ValueError):
         return None
 
 
@@ -152,33 +190,19 @@ def _read_psu_telemetry(psu_idx):
     if cached.get('ts', 0) + _CACHE_TTL > now:
         return cached
 
-    psu_n  = psu_idx + 1   # 1-based for file names
+    paths  = _PSU_TELEMETRY_PATHS[psu_idx]
     result = {'ts': now}
 
-    def _rf_linear11(reg_name):
-        raw = _read_daemon_int('{}/psu_{}_{}'.format(_RUN_DIR, psu_n, reg_name))
-        if raw is None:
-            return None
-        return _pmbus_decode_linear11(raw)
-
-    def _rf_raw(reg_name):
-        return _read_daemon_int('{}/psu_{}_{}'.format(_RUN_DIR, psu_n, reg_name))
-
-    vin  = _rf_linear11('vin')
-    iin  = _rf_linear11('iin')
-    iout = _rf_linear11('iout')
-    pout = _rf_linear11('pout')
-    temp = _rf_linear11('temp')
-
-    if vin  is not None: result['vin']  = vin
-    if iin  is not None: result['iin']  = iin
-    if iout is not None: result['iout'] = iout
-    if pout is not None: result['pout'] = pout
-    if temp is not None: result['temp'] = temp
+    for key in _LINEAR11_KEYS:
+        raw = _read_daemon_int(paths[key])
+        if raw is not None:
+            result[key] = _pmbus_decode_linear11(raw)
 
     # Prefer direct READ_VOUT (LINEAR16, exp=-9 for Delta SPAFCBK-14G).
     # Fall back to POUT/IOUT if the vout cache file is missing or unreadable.
-    vout_raw = _rf_raw('vout')
+    vout_raw = _read_daemon_int(paths['vout'])
+    iout = result.get('iout')
+    pout = result.get('pout')
     if vout_raw is not None:
         result['vout'] = _linear16_vout_to_volts(vout_raw)
     elif iout is not None and pout is not None and iout > 0.0:
@@ -186,7 +210,7 @@ def _read_psu_telemetry(psu_idx):
 
     # READ_FAN_SPEED_1 on Delta SPAFCBK-14G is plain RPM (not LINEAR11),
     # stored as a raw 16-bit integer in the daemon cache.
-    fan_rpm = _rf_raw('fan')
+    fan_rpm = _read_daemon_int(paths['fan'])
     if fan_rpm is not None:
         result['fan_rpm'] = fan_rpm
 
@@ -210,6 +234,8 @@ class Psu(PsuBase):
         PsuBase.__init__(self)
         self._index = index       # 1-based
         self._idx   = index - 1  # 0-based for array indexing
+        self._present_attr = 'psu{}_present'.format(index)
+        self._pgood_attr   = 'psu{}_pgood'.format(index)
 
     # ------------------------------------------------------------------
     # DeviceBase API
@@ -252,7 +278,7 @@ class Psu(PsuBase):
         Returns:
             bool: True when present, False when absent or CPLD unreadable.
         """
-        val = _read_cpld_attr('psu{}_present'.format(self._index))
+        val = _read_cpld_attr(self._present_attr)
         if val is None:
             return False
         return bool(val)
@@ -273,7 +299,7 @@ class Psu(PsuBase):
 
     def get_powergood_status(self):
         """True when the PSU is outputting good power."""
-        val = _read_cpld_attr('psu{}_pgood'.format(self._index))
+        val = _read_cpld_attr(self._pgood_attr)
         if val is None:
             return False
         return bool(val)
@@ -422,6 +448,7 @@ class PsuFan(FanBase):
         FanBase.__init__(self)
         self._psu_index = psu_index          # 1-based
         self._psu_idx   = psu_index - 1     # 0-based for telemetry array
+        self._present_attr = 'psu{}_present'.format(psu_index)
 
     # ------------------------------------------------------------------
     # DeviceBase API
@@ -445,7 +472,7 @@ class PsuFan(FanBase):
         Returns:
             bool: True when the parent PSU is inserted.
         """
-        val = _read_cpld_attr('psu{}_present'.format(self._psu_index))
+        val = _read_cpld_attr(self._present_attr)
         return bool(val) if val is not None else False
 
     def get_status(self):
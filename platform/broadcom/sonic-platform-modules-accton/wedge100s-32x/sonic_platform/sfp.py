@@ -50,6 +50,10 @@ _READ_RESP  = '/run/wedge100s/sfp_{}_read_resp'   # daemon → pmon: hex-encoded
 _WRITE_TIMEOUT_S = 5.0
 _READ_TIMEOUT_S  = 5.0
 
+# Per-port hot-path file names, formatted once and indexed by 0-based port.
+_EEPROM_PATHS  = tuple(_I2C_EEPROM_CACHE.format(p) for p in range(NUM_SFPS))
+_PRESENT_PATHS = tuple(_I2C_PRESENT_CACHE.format(p) for p in range(NUM_SFPS))
+
 # ---------------------------------------------------------------------------
 # Demand-driven DOM cache TTL
 #
@@ -66,6 +70,54 @@ _READ_TIMEOUT_S  = 5.0
 _DOM_CACHE_TTL      = 20              # seconds: max staleness per port
 _DOM_LAST_REFRESH   = [0.0] * NUM_SFPS  # monotonic timestamp of last live read
 
+# ---------------------------------------------------------------------------
+# In-process EEPROM page cache
+#
+# xcvrd pulls many small fields (identifier, vendor name/PN/SN, DOM words)
+# from the same 256-byte page back-to-back.  Keep the last page read per
+# port for _PAGE_CACHE_TTL seconds so that burst is served by one file read.
+# Entries are (monotonic ts, bytearray); None means no cached page.
+# ---------------------------------------------------------------------------
+
+_PAGE_CACHE_TTL = 1.0
+_PAGE_CACHE     = [None] * NUM_SFPS
+
+# ---------------------------------------------------------------------------
+# Shared presence bitmap
+#
+# xcvrd calls get_presence() on every port back-to-back.  The daemon also
+# publishes all 32 bits as one "0x%08x" line (bit N = port N), so read that
+# once per _PRESENCE_CACHE_TTL and serve every Sfp instance from it.  'mask'
+# is None when the bitmap is missing or mid-rewrite; get_presence() then
+# falls back to the per-port sfp_N_present file.
+# ---------------------------------------------------------------------------
+
+_PRESENT_MASK        = '/run/wedge100s/sfp_present_mask'
+_PRESENCE_CACHE_TTL  = 1.0
+_presence_bitmap     = {'ts': 0.0, 'mask': None}
+
+
+def _read_presence_mask():
+    """Read the daemon presence bitmap; return it as an int, or None."""
+    try:
+        fd = os.open(_PRESENT_MASK, os.O_RDONLY)
+        try:
+            return int(os.read(fd, 16), 16)
+        finally:
+            os.close(fd)
+    except (OSError, ValueError):
+        return None
+
+
+def _refresh_presence_bitmap():
+    """Return the cached 32-port presence bitmap, or None if unavailable."""
+    now = time.monotonic()
+    if now - _presence_bitmap['ts'] >= _PRESENCE_CACHE_TTL:
+        _presence_bitmap['mask'] = _read_presence_mask()
+        _presence_bitmap['ts'] = now
+    return _presence_bitmap['mask']
+
+
 def _wait_for_file(path, timeout_s):
     """Poll path until it exists; return True on success, False on timeout."""
     deadline = time.monotonic() + timeout_s
@@ -91,6 +143,17 @@ class Sfp(SfpOptoeBase):
         """
         SfpOptoeBase.__init__(self)
         self._port = port
+        # Per-port names used by the request/response and state paths,
+        # formatted once here rather than on every call.
+        self._name           = 'QSFP28 {}'.format(port + 1)
+        self._read_req_path  = _READ_REQ.format(port)
+        self._read_resp_path = _READ_RESP.format(port)
+        self._write_req_path = _WRITE_REQ.format(port)
+        self._write_ack_path = _WRITE_ACK.format(port)
+        self._lpmode_path    = _LP_MODE_STATE.format(port)
+        self._lpmode_req     = _LP_MODE_REQ.format(port)
+        self._rxlos_path     = _RXLOS_CACHE.format(port)
+        self._present_bit    = 1 << port
 
     # ------------------------------------------------------------------
     # SfpOptoeBase interface
@@ -102,13 +165,15 @@ class Sfp(SfpOptoeBase):
         Returns:
             str: Path to /run/wedge100s/sfp_N_eeprom for this port.
         """
-        return _I2C_EEPROM_CACHE.format(self._port)
+        return _EEPROM_PATHS[self._port]
 
     def read_eeprom(self, offset, num_bytes):
         """Return EEPROM bytes from the daemon cache, refreshing DOM on TTL expiry.
 
         Normal path: reads /run/wedge100s/sfp_N_eeprom written by
         wedge100s-i2c-daemon on insertion.  No I2C transaction unless TTL expires.
+        The page is kept in memory for _PAGE_CACHE_TTL seconds so a burst of
+        field reads costs one file read.
 
         DOM refresh: if offset falls in the lower page (0-127) and the cache is
         older than _DOM_CACHE_TTL seconds, requests a fresh lower-page read via
@@ -122,16 +187,18 @@ class Sfp(SfpOptoeBase):
         Returns:
             bytearray: Requested EEPROM slice, or None if cache file is absent.
         """
-        cache = _I2C_EEPROM_CACHE.format(self._port)
+        cache = _EEPROM_PATHS[self._port]
 
         cached_data = None
-        try:
-            with open(cache, 'rb') as f:
-                raw = f.read(256)
-                if len(raw) == 256:
-                    cached_data = bytearray(raw)
-        except OSError:
-            pass
+        entry = _PAGE_CACHE[self._port]
+        if entry is not None and time.monotonic() - entry[0] < _PAGE_CACHE_TTL:
+            cached_data = entry[1]
+        else:
+            raw = self._pread_cache_page()
+            if raw is not None and len(raw) == 256:
+                cached_data = bytearray(raw)
+            _PAGE_CACHE[self._port] = (
+                None if cached_data is None else (time.monotonic(), cached_data))
 
         if cached_data is None:
             return None
@@ -145,26 +212,54 @@ class Sfp(SfpOptoeBase):
             _DOM_LAST_REFRESH[self._port] = time.monotonic()
             if lower is not None and len(lower) == 128:
                 merged = bytearray(lower) + bytearray(cached_data[128:])
-                tmp = cache + '.tmp'
+                # Per-process temp name: the daemon and other xcvrd/CLI
+                # processes replace this same cache file.
+                tmp = '{}.{}.tmp'.format(cache, os.getpid())
                 try:
                     with open(tmp, 'wb') as f:
                         f.write(merged)
                     os.replace(tmp, cache)
                 except OSError:
+                    try:
+                        os.unlink(tmp)
+                    except OSError:
+                        pass
                     merged = cached_data  # write failed; serve old data
                 cached_data = merged
+                _PAGE_CACHE[self._port] = (time.monotonic(), cached_data)
 
         end = min(offset + num_bytes, 256)
         return cached_data[offset:end]
 
+    def _pread_cache_page(self):
+        """pread() the 256-byte cache page.
+
+        The file is opened per call rather than held: xcvrd drives an Sfp
+        from more than one thread, and _PAGE_CACHE already limits this to
+        one read per port per _PAGE_CACHE_TTL.
+
+        Returns:
+            bytes read (may be short), or None if the file does not exist.
+        """
+        try:
+            fd = os.open(_EEPROM_PATHS[self._port], os.O_RDONLY)
+        except OSError:
+            return None
+        try:
+            return os.pread(fd, 256, 0)
+        except OSError:
+            return None
+        finally:
+            os.close(fd)
+
     def _hardware_read_lower_page(self):
         """Read lower page (bytes 0-127) from hardware via daemon read request file.
 
         Returns:
             bytearray: 128-byte lower page on success, or None on timeout/error.
         """
-        req_path  = _READ_REQ.format(self._port)
-        resp_path = _READ_RESP.format(self._port)
+        req_path  = self._read_req_path
+        resp_path = self._read_resp_path
 
         payload = {"offset": 0, "length": 128}
         try:
@@ -219,8 +314,8 @@ class Sfp(SfpOptoeBase):
         if not (0 <= offset < 256):
             return False
 
-        req_path = _WRITE_REQ.format(self._port)
-        ack_path = _WRITE_ACK.format(self._port)
+        req_path = self._write_req_path
+        ack_path = self._write_ack_path
 
         payload = {
             "offset": offset,
@@ -257,6 +352,8 @@ class Sfp(SfpOptoeBase):
         except OSError:
             return False
 
+        # The daemon rewrote the cache file; drop the in-memory page.
+        _PAGE_CACHE[self._port] = None
         return result == "ok"
 
     # ------------------------------------------------------------------
@@ -269,18 +366,22 @@ class Sfp(SfpOptoeBase):
         Returns:
             str: Port name in format 'QSFP28 N' (1-based).
         """
-        return 'QSFP28 {}'.format(self._port + 1)
+        return self._name
 
     def get_presence(self):
         """Check if a QSFP28 module is physically inserted in this port.
 
-        Reads /run/wedge100s/sfp_N_present written by wedge100s-i2c-daemon
-        every 3 s.
+        Served from the shared presence bitmap written by
+        wedge100s-i2c-daemon every 3 s; falls back to
+        /run/wedge100s/sfp_N_present when the bitmap is unavailable.
 
         Returns:
             bool: True if present, False if absent or daemon not yet started.
         """
-        cache_file = _I2C_PRESENT_CACHE.format(self._port)
+        mask = _refresh_presence_bitmap()
+        if mask is not None:
+            return bool(mask & self._present_bit)
+        cache_file = _PRESENT_PATHS[self._port]
         try:
             with open(cache_file) as f:
                 return f.read().strip() == '1'
@@ -316,7 +417,7 @@ class Sfp(SfpOptoeBase):
         If the state file does not exist (daemon not yet run), returns True
         (conservative: hardware default is asserted via PCB pull-ups).
         """
-        state_file = _LP_MODE_STATE.format(self._port)
+        state_file = self._lpmode_path
         try:
             with open(state_file) as f:
                 return f.read().strip() == '1'
@@ -341,7 +442,7 @@ class Sfp(SfpOptoeBase):
             bool: True on successful file write (async — hardware state
                 changes after the next daemon tick, ~3 s later).
         """
-        req_file = _LP_MODE_REQ.format(self._port)
+        req_file = self._lpmode_req
         try:
             with open(req_file, 'w') as f:
                 f.write('1' if lpmode else '0')
@@ -389,7 +490,7 @@ class Sfp(SfpOptoeBase):
             list[bool]: [lane0, lane1, lane2, lane3] — True if RX loss detected.
                         Returns [False]*4 if data unavailable.
         """
-        path = _RXLOS_CACHE.format(self._port)
+        path = self._rxlos_path
         try:
             with open(path) as f:
                 loss = f.read().strip() == '1'
@@ -24,6 +24,8 @@ Verified on hardware (hare-lorax, SONiC 6.1.0-29-2-amd64, 2026-02-25):
 """
 
 import glob as _glob
+import os
+import time
 
 try:
     from sonic_platform_base.thermal_base import ThermalBase
@@ -64,6 +66,24 @@ _SENSORS = [
 
 NUM_THERMALS = len(_SENSORS)
 
+def _read_millideg(path):
+    """Return a millidegree reading (sysfs or daemon file) in °C, or None."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        return int(os.read(fd, 16)) / 1000.0
+    except (OSError, ValueError):
+        return None
+    finally:
+        os.close(fd)
+
+
+# get_status() and get_temperature() are called back-to-back by thermalctld;
+# serve the second from the first read.  The daemon files change every 10 s.
+_READ_CACHE_TTL = 0.25   # seconds
+
 
 class Thermal(ThermalBase):
     """Platform-specific Thermal class for Accton Wedge 100S-32X."""
@@ -80,36 +100,50 @@ class Thermal(ThermalBase):
             _SENSORS[index]
         self._min_recorded = None
         self._max_recorded = None
+        # Expanded host sysfs paths; hwmonN is stable for the kernel's life.
+        self._cached_paths = None
+        self._last_read_ts  = 0.0
+        self._last_read_val = None
+        # Reader for this sensor's source, resolved once.
+        self._reader = (self._read_host_temp_max if self._source == "host"
+                        else self._read_daemon_temp)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
     def _read_temperature(self):
-        """Return current temperature in °C, or None on failure."""
-        if self._source == "host":
-            return self._read_host_temp_max()
-        return self._read_daemon_temp()
+        """Return current temperature in °C, or None on failure.
+
+        Memoised for _READ_CACHE_TTL seconds.
+        """
+        now = time.monotonic()
+        if now - self._last_read_ts < _READ_CACHE_TTL:
+            return self._last_read_val
+        val = self._reader()
+        self._last_read_ts  = now
+        self._last_read_val = val
+        return val
 
     def _read_host_temp_max(self):
         """
         Glob-expand the coretemp sysfs path on the host filesystem and
         return the maximum reading across all matched files (millidegrees
         → degrees).  Mirrors ONL's onlp_file_read_int_max().
+
+        The expansion is cached after the first success and redone when
+        any cached path stops reading (e.g. coretemp reloaded).
         """
-        paths = _glob.glob(self._path)
-        if not paths:
-            return None
-        best = None
-        for p in paths:
-            try:
-                with open(p, 'r') as f:
-                    val = float(f.read().strip()) / 1000.0
-                if best is None or val > best:
-                    best = val
-            except (IOError, OSError, ValueError):
-                pass
-        return best
+        paths = self._cached_paths
+        if paths is None:
+            paths = _glob.glob(self._path)
+            if not paths:
+                return None
+            self._cached_paths = paths
+        readings = list(map(_read_millideg, paths))
+        if None in readings:
+            self._cached_paths = None
+        return max((v for v in readings if v is not None), default=None)
 
     def _read_daemon_temp(self):
         """
@@ -117,11 +151,7 @@ class Thermal(ThermalBase):
         The file contains a plain decimal integer in millidegrees C written
         by wedge100s-bmc-daemon (R28); divide by 1000 to get °C.
         """
-        try:
-            with open(self._path) as f:
-                return int(f.read().strip()) / 1000.0
-        except (IOError, OSError, ValueError):
-            return None
+        return _read_millideg(self._path)
 
     def _update_minmax(self, temp):
         if temp is not None:
@@ -38,6 +38,8 @@ import sys
 import logging
 import os
 import re
+import ctypes
+import fcntl
 import time
 
 PROJECT_NAME = 'wedge100s_32x'
@@ -70,6 +72,33 @@ _CPLD_BUS  = 1
 _CPLD_ADDR = 0x32
 _PSU_REG   = 0x10
 
+# i2c-dev I2C_RDWR ioctl (linux/i2c-dev.h, linux/i2c.h).  A register read is
+# issued as one combined write+read transfer (repeated START, no STOP between
+# the register byte and the data), so another CP2112 client cannot slip in
+# between.  I2C_RDWR also bypasses the driver-bound address check, which is
+# what 'i2cget -f' needed I2C_SLAVE_FORCE for.
+_I2C_RDWR = 0x0707
+_I2C_M_RD = 0x0001
+
+
+class _I2cMsg(ctypes.Structure):
+    """struct i2c_msg"""
+    _fields_ = [('addr',  ctypes.c_uint16),
+                ('flags', ctypes.c_uint16),
+                ('len',   ctypes.c_uint16),
+                ('buf',   ctypes.POINTER(ctypes.c_uint8))]
+
+
+class _I2cRdwrData(ctypes.Structure):
+    """struct i2c_rdwr_ioctl_data"""
+    _fields_ = [('msgs',  ctypes.POINTER(_I2cMsg)),
+                ('nmsgs', ctypes.c_uint32)]
+
+
+# One persistent /dev/i2c-N fd per bus, opened on first use.  Replaces the
+# per-call fork/exec of i2cget (~20 ms each) with a single ioctl.
+_i2c_fds = {}     # bus -> fd
+
 # Kernel modules — Phase 2 (wedge100s-i2c-daemon owns the CP2112 mux tree).
 # i2c_mux_pca954x, at24, and optoe are intentionally absent:
 #   wedge100s-i2c-daemon reads QSFP EEPROMs and system EEPROM via /dev/hidraw0
@@ -77,11 +106,13 @@ _PSU_REG   = 0x10
 #   kernel probe-writes to QSFP EEPROM address 0x50 on every platform init.
 # hid_cp2112 is kept: CPLD at i2c-1/0x32 is needed by psu.py and led_control.py.
 # i2c_ismt and lm75 are intentionally absent (no iSMT; thermal on BMC I2C).
+# Module names in load order; loaded with one 'modprobe -a', unloaded in
+# reverse with one 'modprobe -rq'.  None of them take parameters.
 kos = [
-    'modprobe i2c_dev',
-    'modprobe i2c_i801',
-    'modprobe hid_cp2112',
-    'modprobe wedge100s_cpld',
+    'i2c_dev',
+    'i2c_i801',
+    'hid_cp2112',
+    'wedge100s_cpld',
 ]
 
 # I2C device registration — Phase 2 (wedge100s-i2c-daemon).
@@ -90,11 +121,14 @@ kos = [
 # wedge100s-i2c-daemon owns them via /dev/hidraw0.  Registering i2c_mux_pca954x
 # would cause kernel probe-writes to QSFP EEPROM 0x50 on every platform init,
 # which is the root cause of the transceiver EEPROM corruption.
+# Each entry is (bus, driver, addr); written directly to sysfs, no shell.
 mknod = [
     # CPLD is directly on i2c-1 (no mux needed); wedge100s_cpld driver.
-    'echo wedge100s_cpld 0x32 > /sys/bus/i2c/devices/i2c-1/new_device',
+    (1, 'wedge100s_cpld', 0x32),
 ]
 
+_I2C_BUS_DIR = '/sys/bus/i2c/devices/i2c-{}'
+
 
 def main():
     """Parse command-line arguments and dispatch to the appropriate subcommand.
@@ -179,39 +213,52 @@ def my_log(txt):
         print("[DBG] " + txt)
 
 
-def log_os_system(cmd, show):
-    """Run a shell command and log its output in debug mode.
+def log_os_system(argv, show):
+    """Run a command without a shell and log its output in debug mode.
 
     Args:
-        cmd: Shell command string to execute.
+        argv: Command and arguments as a list.
         show: If True, print a 'Failed:' message on non-zero exit.
 
     Returns:
-        tuple: (exit_status, output_string) from subprocess.getstatusoutput.
+        tuple: (exit_status, output_string) with stderr merged into the
+        output and the trailing newline stripped, as getstatusoutput().
     """
-    logging.info('Run :' + cmd)
-    status, output = subprocess.getstatusoutput(cmd)
-    my_log(cmd + " => " + str(status))
-    if output:
-        my_log("  " + output)
+    cmd = ' '.join(argv)
+    logging.info('Run :%s', cmd)
+    try:
+        proc = subprocess.run(argv, stdout=subprocess.PIPE,
+                              stderr=subprocess.STDOUT, text=True)
+        status, output = proc.returncode, proc.stdout.rstrip('\n')
+    except OSError as e:
+        status, output = 127, str(e)
+    # Build the debug strings only when they will be printed.
+    if DEBUG:
+        my_log(cmd + " => " + str(status))
+        if output:
+            my_log("  " + output)
     if status and show:
         print('Failed: ' + cmd)
     return status, output
 
 
 def driver_check():
-    """Return True if all required modules are loaded (hid_cp2112 + i2c_dev)."""
-    ret, _ = log_os_system("lsmod | grep -q hid_cp2112", 0)
-    if ret != 0:
+    """Return True if all required modules are loaded (hid_cp2112 + i2c_dev).
+
+    Reads /proc/modules directly rather than forking 'lsmod | grep'; this
+    runs on every show/sff/set command via system_ready().
+    """
+    try:
+        with open('/proc/modules') as f:
+            loaded = {line.split(' ', 1)[0] for line in f}
+    except (IOError, OSError):
         return False
-    ret, _ = log_os_system("lsmod | grep -q i2c_dev", 0)
-    return ret == 0
+    return 'hid_cp2112' in loaded and 'i2c_dev' in loaded
 
 
 def device_exist():
     """Return True if the CPLD (0x32) is registered on i2c-1."""
-    ret, _ = log_os_system("ls /sys/bus/i2c/devices/1-0032", 0)
-    return ret == 0
+    return os.path.isdir('/sys/bus/i2c/devices/1-0032')
 
 
 def system_ready():
@@ -226,50 +273,80 @@ def system_ready():
 def driver_install():
     """Load all required kernel modules listed in the kos array.
 
-    Runs 'depmod' first, then each modprobe command in order.
-    Stops on the first failure unless FORCE is set.
+    Runs 'depmod' and a single 'modprobe -a' over kos, so the install costs
+    two processes and no shell.  modprobe -a loads in argument order and
+    exits non-zero if any module failed.
 
     Returns:
-        int: 0 on success, non-zero exit code on first failure.
+        int: 0 on success (or when FORCE is set), non-zero on failure.
     """
     global FORCE
-    log_os_system("depmod", 1)
-    for ko in kos:
-        status, _ = log_os_system(ko, 1)
-        if status and FORCE == 0:
-            return status
-    return 0
+    log_os_system(['depmod'], 1)
+    status, _ = log_os_system(['modprobe', '-a'] + kos, 1)
+    return 0 if FORCE else status
 
 
 def driver_uninstall():
     """Unload kernel modules in reverse order from the kos array.
 
     Returns:
-        int: 0 on success, non-zero exit code on first failure.
+        int: 0 on success (or when FORCE is set), non-zero on failure.
     """
     global FORCE
-    for ko in reversed(kos):
-        rm = ko.replace("modprobe", "modprobe -rq")
-        status, _ = log_os_system(rm, 1)
-        if status and FORCE == 0:
-            return status
-    return 0
+    status, _ = log_os_system(['modprobe', '-rq'] + kos[::-1], 1)
+    return 0 if FORCE else status
+
+
+def _sysfs_write(path, text):
+    """Write text to a sysfs or /run/wedge100s control file.
+
+    Returns:
+        tuple: (status, message) — 0 and '' on success, 1 and the error
+        text on failure, mirroring log_os_system().
+    """
+    logging.info('Write :%s > %s', text, path)
+    try:
+        with open(path, 'w') as f:
+            f.write(text)
+    except (IOError, OSError) as e:
+        if DEBUG:
+            my_log(path + " => " + str(e))
+        print('Failed: ' + text + ' > ' + path)
+        return 1, str(e)
+    return 0, ''
+
+
+def _wait_for_dir(path, timeout=0.5, interval=0.01):
+    """Poll until path is a directory or timeout seconds pass.
+
+    Returns:
+        bool: True if the directory appeared in time.
+    """
+    deadline = time.monotonic() + timeout
+    while not os.path.isdir(path):
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+    return True
 
 
 def device_install():
     """Register I2C devices by writing to new_device sysfs entries.
 
-    Executes each command in the mknod list.  Stops on the first failure
+    Writes each entry in the mknod list.  Stops on the first failure
     unless FORCE is set.
 
     Returns:
         int: 0 on success, non-zero exit code on first failure.
     """
     global FORCE
-    for cmd in mknod:
-        if 'pca954' in cmd:
-            time.sleep(0.5)  # allow kernel to enumerate new mux channels
-        status, output = log_os_system(cmd, 1)
+    for bus, driver, addr in mknod:
+        bus_dir = _I2C_BUS_DIR.format(bus)
+        # A device behind a mux sits on a bus the previous entry created;
+        # wait for that bus rather than sleeping a fixed 0.5 s.
+        _wait_for_dir(bus_dir)
+        status, output = _sysfs_write(bus_dir + '/new_device',
+                                      '{} {:#04x}'.format(driver, addr))
         if status:
             print(output)
             if FORCE == 0:
@@ -280,13 +357,9 @@ def device_install():
 def device_uninstall():
     """Unregister devices in reverse registration order."""
     global FORCE
-    for cmd in reversed(mknod):
-        parts = cmd.split()
-        # parts: ['echo', '<driver>', '<addr>', '>', '/sys/.../new_device']
-        addr = parts[2]
-        target = parts[-1].replace('new_device', 'delete_device')
-        rm_cmd = "echo {} > {}".format(addr, target)
-        status, output = log_os_system(rm_cmd, 1)
+    for bus, _, addr in reversed(mknod):
+        status, output = _sysfs_write(
+            _I2C_BUS_DIR.format(bus) + '/delete_device', '{:#04x}'.format(addr))
         if status:
             print(output)
             if FORCE == 0:
@@ -379,10 +452,10 @@ def do_sonic_platform_install():
     device_path = "{}{}{}{}".format(PLATFORM_ROOT_PATH, '/x86_64-accton_', PROJECT_NAME, '-r0')
     SONIC_PLATFORM_BSP_WHL_PKG_PY3 = "/".join([device_path, PLATFORM_API2_WHL_FILE_PY3])
 
-    status, output = log_os_system("pip3 show sonic-platform > /dev/null 2>&1", 0)
+    status, output = log_os_system(['pip3', 'show', 'sonic-platform'], 0)
     if status:
         if os.path.exists(SONIC_PLATFORM_BSP_WHL_PKG_PY3):
-            status, output = log_os_system("pip3 install " + SONIC_PLATFORM_BSP_WHL_PKG_PY3, 1)
+            status, output = log_os_system(['pip3', 'install', SONIC_PLATFORM_BSP_WHL_PKG_PY3], 1)
             if status:
                 print("Error: Failed to install {}".format(PLATFORM_API2_WHL_FILE_PY3))
                 return status
@@ -395,11 +468,11 @@ def do_sonic_platform_install():
 
 
 def do_sonic_platform_clean():
-    status, output = log_os_system("pip3 show sonic-platform > /dev/null 2>&1", 0)
+    status, output = log_os_system(['pip3', 'show', 'sonic-platform'], 0)
     if status:
         print('{} does not install, not need to uninstall'.format(PLATFORM_API2_WHL_FILE_PY3))
     else:
-        status, output = log_os_system("pip3 uninstall sonic-platform -y", 0)
+        status, output = log_os_system(['pip3', 'uninstall', 'sonic-platform', '-y'], 0)
         if status:
             print('Error: Failed to uninstall {}'.format(PLATFORM_API2_WHL_FILE_PY3))
         else:
@@ -586,34 +659,101 @@ def do_uninstall():
     do_sonic_platform_clean()
 
 
+# ── i2c-dev helpers ───────────────────────────────────────────────────────────
+
+def _i2c_fd(bus):
+    """Return the cached /dev/i2c-<bus> fd, opening it on first use.
+
+    Raises:
+        OSError: If the bus device node cannot be opened.
+    """
+    fd = _i2c_fds.get(bus)
+    if fd is None:
+        fd = os.open('/dev/i2c-{}'.format(bus), os.O_RDWR)
+        _i2c_fds[bus] = fd
+    return fd
+
+
+def _i2c_read_block(bus, addr, reg, length):
+    """Read length consecutive register bytes in one I2C_RDWR transfer.
+
+    Args:
+        bus: I2C bus number (/dev/i2c-N).
+        addr: 7-bit device address.
+        reg: First register (command) byte.
+        length: Number of bytes to read (register auto-increment).
+
+    Returns:
+        bytes: The register contents.
+
+    Raises:
+        OSError: On open, ioctl, or transfer failure.
+    """
+    wbuf = (ctypes.c_uint8 * 1)(reg)
+    rbuf = (ctypes.c_uint8 * length)()
+    msgs = (_I2cMsg * 2)(
+        _I2cMsg(addr, 0, 1, wbuf),
+        _I2cMsg(addr, _I2C_M_RD, length, rbuf),
+    )
+    data = _I2cRdwrData(msgs, 2)
+    fcntl.ioctl(_i2c_fd(bus), _I2C_RDWR, data)
+    return bytes(rbuf)
+
+
+def _i2c_read_byte(bus, addr, reg):
+    """Read one register byte (equivalent of 'i2cget -f -y').
+
+    Raises:
+        OSError: On open, ioctl, or transfer failure.
+    """
+    return _i2c_read_block(bus, addr, reg, 1)[0]
+
+
 # ── PCA9535 presence helpers ──────────────────────────────────────────────────
 
-def _bit_swap(value):
-    """Swap even/odd bit pairs per ONL sfpi.c onlp_sfpi_reg_val_to_port_sequence().
-    Corrects PCA9535 GPIO wiring vs. front-panel QSFP port order."""
-    result = 0
-    for i in range(8):
-        if i % 2 == 1:
-            result |= (value & (1 << i)) >> 1
-        else:
-            result |= (value & (1 << i)) << 1
-    return result
+# Even/odd bit-pair swap per ONL sfpi.c onlp_sfpi_reg_val_to_port_sequence().
+# Corrects PCA9535 GPIO wiring vs. front-panel QSFP port order.
+_SWAP_LUT = bytes(((v & 0x55) << 1) | ((v & 0xAA) >> 1) for v in range(256))
 
 
-def _qsfp_present(port_num):
-    """Return True if QSFP port_num (0-based) has a module inserted."""
+def _presence_location(port_num):
+    """Return (bus, addr, offset, bitmask) of port_num's PCA9535 presence bit."""
     group  = 0 if port_num < 16 else 1
-    bus    = _PRESENCE_BUS[group]
-    addr   = _PRESENCE_ADDR[group]
-    local  = port_num % 16
-    offset = 0 if local < 8 else 1
-    try:
-        cmd = "i2cget -f -y {} 0x{:02x} 0x{:02x}".format(bus, addr, offset)
-        out = subprocess.check_output(cmd, shell=True).decode().strip()
-        swapped = _bit_swap(int(out, 0))
-        return not bool(swapped & (1 << (port_num % 8)))
-    except Exception:
-        return False
+    offset = 0 if port_num % 16 < 8 else 1
+    return (_PRESENCE_BUS[group], _PRESENCE_ADDR[group], offset,
+            1 << (port_num % 8))
+
+
+# Per-port presence bit location, indexed by 0-based port.
+_PRESENCE_TBL = tuple(_presence_location(p) for p in range(NUM_SFP))
+
+
+def _qsfp_presence_all():
+    """Return a list of 32 presence values (0-based port order).
+
+    Reads both input ports of each PCA9535 with one write(0)+read(2)
+    I2C_RDWR transfer, relying on register auto-increment (2 ioctls total
+    instead of one per port).  hid-cp2112 accepts only a single message or
+    a same-address write+read pair, so the two registers cannot be fetched
+    as separate message pairs.
+
+    Returns:
+        list: True/False per port, or None for the 16 ports of an expander
+        that could not be read.
+    """
+    present = [None] * NUM_SFP
+    for group in range(2):
+        try:
+            raw = _i2c_read_block(_PRESENCE_BUS[group], _PRESENCE_ADDR[group],
+                                  0, 2)
+        except OSError as e:
+            my_log("PCA9535 i2c-{} read failed: {}".format(
+                _PRESENCE_BUS[group], e))
+            continue
+        for port in range(group * 16, group * 16 + 16):
+            _, _, offset, bit = _PRESENCE_TBL[port]
+            present[port] = not _SWAP_LUT[raw[offset]] & bit
+    return present
 
 
 # ── show / device_traversal ───────────────────────────────────────────────────
@@ -627,11 +767,7 @@ def device_traversal():
     print("PSU:")
     print("=" * 50)
     try:
-        out = subprocess.check_output(
-            "i2cget -f -y {} 0x{:02x} 0x{:02x}".format(
-                _CPLD_BUS, _CPLD_ADDR, _PSU_REG),
-            shell=True).decode().strip()
-        val = int(out, 0)
+        val = _i2c_read_byte(_CPLD_BUS, _CPLD_ADDR, _PSU_REG)
         pres_bits  = [0, 4]
         pgood_bits = [1, 5]
         for idx in range(2):
@@ -648,9 +784,12 @@ def device_traversal():
     print("=" * 50)
     print("QSFP Presence (ports 1-32):")
     print("=" * 50)
-    for port in range(NUM_SFP):
-        present = _qsfp_present(port)
-        print("  Port {:2d}: {}".format(port + 1, "present" if present else "absent"))
+    for port, present in enumerate(_qsfp_presence_all()):
+        if present is None:
+            state = "unknown (PCA9535 read failed)"
+        else:
+            state = "present" if present else "absent"
+        print("  Port {:2d}: {}".format(port + 1, state))
 
     print()
     print("Note: Fans and thermal sensors are managed by OpenBMC via /dev/ttyACM0.")
@@ -659,6 +798,29 @@ def device_traversal():
 
 # ── sff (QSFP EEPROM dump) ────────────────────────────────────────────────────
 
+def _hexdump_c(data):
+    """Format bytes like 'hexdump -C', including '*' for repeated lines."""
+    lines = []
+    prev = None
+    starred = False
+    for off in range(0, len(data), 16):
+        chunk = data[off:off + 16]
+        if chunk == prev and len(chunk) == 16:
+            if not starred:
+                lines.append('*')
+                starred = True
+            continue
+        prev = chunk
+        starred = False
+        hexes = ['{:02x}'.format(b) for b in chunk]
+        hexes += ['  '] * (16 - len(chunk))
+        text = ''.join(chr(b) if 0x20 <= b < 0x7f else '.' for b in chunk)
+        lines.append('{:08x}  {}  {}  |{}|'.format(
+            off, ' '.join(hexes[:8]), ' '.join(hexes[8:]), text))
+    lines.append('{:08x}'.format(len(data)))
+    return '\n'.join(lines)
+
+
 def show_eeprom(index):
     port = int(index) - 1  # convert 1-based to 0-based
     cache_path = SFP_EEPROM_CACHE_FMT.format(port)
@@ -676,23 +838,15 @@ def show_eeprom(index):
             print("Port {}: daemon cache not yet available (wedge100s-i2c-daemon not run?).".format(index))
         return
 
-    ret, log = log_os_system("which hexdump", 0)
-    if ret == 0:
-        hex_cmd = 'hexdump'
-    else:
-        ret, log = log_os_system("which busybox", 0)
-        if ret == 0:
-            hex_cmd = 'busybox hexdump'
-        else:
-            print("hexdump not found.")
-            return 1
+    try:
+        with open(cache_path, 'rb') as f:
+            data = f.read()
+    except (IOError, OSError):
+        print("No module present or eeprom not readable.")
+        return
 
     print("Port {} EEPROM (daemon cache: {}):".format(index, cache_path))
-    ret, log = log_os_system("cat {} | {} -C".format(cache_path, hex_cmd), 1)
-    if ret == 0:
-        print(log)
-    else:
-        print("No module present or eeprom not readable.")
+    print(_hexdump_c(data))
 
 
 # ── set ───────────────────────────────────────────────────────────────────────
@@ -716,12 +870,13 @@ def set_device(args):
             return
         # Fan speed is set via BMC TTY using set_fan_speed.sh (implemented in bmc.py / fan.py).
         # This CLI shim invokes it directly without the pmon sonic_platform layer.
-        log_os_system("bash -c 'echo 2 > /run/wedge100s/led_sys1'", 0)  # keep SYS1 green while adjusting
+        _sysfs_write('/run/wedge100s/led_sys1', '2')  # keep SYS1 green while adjusting
         status, output = log_os_system(
-            "python3 -c \"import sys; sys.path.insert(0,'/usr/lib/python3/dist-packages');"
-            "from sonic_platform import bmc; "
-            "r=bmc.send_command('set_fan_speed.sh {}'); "
-            "print('OK' if r else 'FAILED')\"".format(pct), 1)
+            ['python3', '-c',
+             "import sys; sys.path.insert(0,'/usr/lib/python3/dist-packages');"
+             "from sonic_platform import bmc; "
+             "r=bmc.send_command('set_fan_speed.sh {}'); "
+             "print('OK' if r else 'FAILED')".format(pct)], 1)
         print("Fan speed set to {}%: {}".format(pct, output.strip()))
     elif args[0] == 'led':
         # SYS1 (0x3e) and SYS2 (0x3f) via CPLD at i2c-1/0x32.
@@ -734,9 +889,11 @@ def set_device(args):
         except ValueError:
             show_set_help()
             return
+        # Plain file writes; wedge100s-i2c-daemon picks both up on its next
+        # LED pass and applies them to the CPLD.
+        val = str(color)
         for attr in ('led_sys1', 'led_sys2'):
-            log_os_system(
-                "bash -c 'echo {val} > /run/wedge100s/{attr}'".format(val=color, attr=attr), 1)
+            _sysfs_write('/run/wedge100s/' + attr, val)
         print("LED color set to 0x{:02x}".format(color))
     elif args[0] == 'sfp':
         # QSFP LP_MODE / RESET pins are on the mux board and not accessible
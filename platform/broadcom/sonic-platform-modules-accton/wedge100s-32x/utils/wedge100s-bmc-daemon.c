@@ -13,8 +13,9 @@
  *   - ControlMaster (-f -N) established once per invocation; all subsequent
  *     commands reuse the socket with ControlMaster=no.  Overhead is one
  *     SSH handshake per 10 s cycle instead of one per command.
- *   - popen(ssh … 'bmc-cmd') replaces the TTY send_cmd/read_until loop.
- *     Output is clean (no echo, no prompt noise): first line → strtol().
+ *   - ssh … 'bmc-cmd' (spawned directly, no local /bin/sh) replaces the
+ *     TTY send_cmd/read_until loop.  Output is clean (no echo, no prompt
+ *     noise): first line → strtol().
  *   - Write-requests: platform code writes /run/wedge100s/<file>.set;
  *     dispatch_write_requests() detects via inotify, runs the mapped BMC
  *     command via SSH, removes the .set file.  Sysfs attribute writes are
@@ -56,6 +57,11 @@
 #include <sys/inotify.h>
 #include <sys/timerfd.h>
 #include <ctype.h>
+#include <fcntl.h>
+#include <spawn.h>
+#include <sys/wait.h>
+
+extern char **environ;
 
 /* ── constants ─────────────────────────────────────────────────────────── */
 
@@ -65,15 +71,17 @@
 #define RUN_DIR     "/run/wedge100s"
 
 /*
- * SSH prefix for bmc_run / bmc_read_int.
- * Not used as a printf format string; appended literally via strncat.
- * The literal % in the BMC address (IPv6 zone-id) requires no escaping here.
+ * ssh argv for bmc_run / bmc_read_int; the BMC command is appended as the
+ * final argument.  Spawned directly (no /bin/sh -c), so neither the BMC
+ * command nor the literal % in the IPv6 zone-id needs local quoting.
  */
-static const char SSH_CTL[] =
-    "ssh -o StrictHostKeyChecking=no -o BatchMode=yes "
-    "-o ConnectTimeout=5 -i " BMC_KEY " "
-    "-o ControlMaster=no -o ControlPath=" CTL_SOCK " "
-    "root@fe80::ff:fe00:1%usb0 ";
+#define SSH_CTL_ARGC 14
+static const char *const SSH_CTL_ARGV[SSH_CTL_ARGC] = {
+    "ssh", "-o", "StrictHostKeyChecking=no", "-o", "BatchMode=yes",
+    "-o", "ConnectTimeout=5", "-i", BMC_KEY,
+    "-o", "ControlMaster=no", "-o", "ControlPath=" CTL_SOCK,
+    "root@fe80::ff:fe00:1%usb0",
+};
 
 static const char SSH_MASTER[] =
     "ssh -o StrictHostKeyChecking=no -o BatchMode=yes "
@@ -127,28 +135,106 @@ static int write_str_file(const char *path, const char *str)
     return 0;
 }
 
-/* ── build_ssh_cmd ───────────────────────────────────────────────────────── */
+/* ── ssh_spawn ───────────────────────────────────────────────────────────── */
 /**
- * @brief Construct a complete SSH command string for a BMC remote command.
- *
- * Concatenates the static SSH_CTL prefix (ControlMaster=no socket reuse)
- * with the quoted BMC command and an optional suffix. Avoids using SSH_CTL
- * as a printf format string to prevent misinterpretation of the literal '%'
- * in the IPv6 zone-id.
- *
- * @param buf     Output buffer for the assembled shell command.
- * @param bufsz   Size of buf in bytes.
- * @param bmc_cmd BMC shell command to execute (will be single-quoted).
- * @param suffix  Optional string appended after the quoted command (e.g.
- *                " >/dev/null 2>&1"), or NULL for none.
+ * @brief Start ssh for a BMC remote command without an intermediate shell.
+ *
+ * posix_spawnp()s SSH_CTL_ARGV + bmc_cmd over the ControlMaster socket.
+ * Compared with popen()/system() this saves one /bin/sh fork+exec per BMC
+ * command.  The child's stderr always goes to /dev/null; its stdout goes to
+ * a pipe returned in *out_fd, or to /dev/null when out_fd is NULL.
+ *
+ * @param bmc_cmd BMC shell command to run (one argv element; the BMC-side
+ *                shell parses it).
+ * @param out_fd  Out-parameter for the read end of the stdout pipe, or NULL.
+ * @return Child pid on success, -1 on pipe/spawn failure.
  */
-static void build_ssh_cmd(char *buf, size_t bufsz,
-                           const char *bmc_cmd, const char *suffix)
+static pid_t ssh_spawn(const char *bmc_cmd, int *out_fd)
 {
-    size_t pfx = strlen(SSH_CTL);
-    if (pfx >= bufsz) { buf[0] = '\0'; return; }
-    memcpy(buf, SSH_CTL, pfx);
-    snprintf(buf + pfx, bufsz - pfx, "'%s'%s", bmc_cmd, suffix ? suffix : "");
+    const char *argv[SSH_CTL_ARGC + 2];
+    posix_spawn_file_actions_t fa;
+    int pfd[2] = {-1, -1};
+    pid_t pid;
+    int rc;
+
+    memcpy(argv, SSH_CTL_ARGV, sizeof(SSH_CTL_ARGV));
+    argv[SSH_CTL_ARGC]     = bmc_cmd;
+    argv[SSH_CTL_ARGC + 1] = NULL;
+
+    if (out_fd && pipe(pfd) < 0)
+        return -1;
+
+    posix_spawn_file_actions_init(&fa);
+    if (out_fd) {
+        posix_spawn_file_actions_adddup2(&fa, pfd[1], STDOUT_FILENO);
+        posix_spawn_file_actions_addclose(&fa, pfd[0]);
+        posix_spawn_file_actions_addclose(&fa, pfd[1]);
+    } else
+        posix_spawn_file_actions_addopen(&fa, STDOUT_FILENO, "/dev/null",
+                                         O_WRONLY, 0);
+    posix_spawn_file_actions_addopen(&fa, STDERR_FILENO, "/dev/null",
+                                     O_WRONLY, 0);
+
+    rc = posix_spawnp(&pid, "ssh", &fa, NULL, (char *const *)argv, environ);
+    posix_spawn_file_actions_destroy(&fa);
+
+    if (out_fd) {
+        close(pfd[1]);
+        if (rc != 0) {
+            close(pfd[0]);
+            return -1;
+        }
+        *out_fd = pfd[0];
+    }
+    return rc == 0 ? pid : -1;
+}
+
+/**
+ * @brief Reap a child started by ssh_spawn().
+ *
+ * @param pid Child pid returned by ssh_spawn().
+ * @return Wait status in system(3) form (0 on success), -1 on waitpid error.
+ */
+static int ssh_wait(pid_t pid)
+{
+    int status;
+    while (waitpid(pid, &status, 0) < 0) {
+        if (errno != EINTR) return -1;
+    }
+    return status;
+}
+
+/**
+ * @brief popen()-style wrapper around ssh_spawn() for reading BMC output.
+ *
+ * @param bmc_cmd BMC shell command to run.
+ * @param pid     Out-parameter for the child pid (pass to ssh_pclose()).
+ * @return stdio stream on the child's stdout, or NULL on failure.
+ */
+static FILE *ssh_popen(const char *bmc_cmd, pid_t *pid)
+{
+    int fd;
+    FILE *fp;
+
+    *pid = ssh_spawn(bmc_cmd, &fd);
+    if (*pid < 0) return NULL;
+    fp = fdopen(fd, "r");
+    if (!fp) {
+        close(fd);
+        ssh_wait(*pid);
+    }
+    return fp;
+}
+
+/**
+ * @brief Close a stream from ssh_popen() and reap the child.
+ *
+ * @return Wait status as from ssh_wait().
+ */
+static int ssh_pclose(FILE *fp, pid_t pid)
+{
+    fclose(fp);
+    return ssh_wait(pid);
 }
 
 static const char SSH_CHECK[] =
@@ -167,15 +253,15 @@ static const char SSH_CHECK[] =
  * BMC-side script, turning a 30-second diagnosis into a multi-hour one.
  *
  * @param bmc_cmd Shell command to run on the BMC.
- * @return The exit status as returned by system(3) — 0 on success, non-zero
+ * @return The wait status in system(3) form — 0 on success, non-zero
  *         on any failure (including SSH-layer errors and BMC-side errors).
  */
 static int bmc_run(const char *bmc_cmd)
 {
-    char shell_cmd[512];
+    pid_t pid;
     int rc;
-    build_ssh_cmd(shell_cmd, sizeof(shell_cmd), bmc_cmd, " >/dev/null 2>&1");
-    rc = system(shell_cmd);
+    pid = ssh_spawn(bmc_cmd, NULL);
+    rc  = pid < 0 ? -1 : ssh_wait(pid);
     if (rc == 0) {
         syslog(LOG_INFO, "wedge100s-bmc-daemon: bmc_run OK: %s", bmc_cmd);
     } else {
@@ -189,7 +275,7 @@ static int bmc_run(const char *bmc_cmd)
 /**
  * @brief Run a BMC command via SSH and parse its first output line as an integer.
  *
- * Uses popen() over the ControlMaster socket. Strips trailing newline before
+ * Uses ssh_popen() over the ControlMaster socket. Strips trailing newline before
  * parsing with strtol().
  *
  * @param bmc_cmd Shell command to run on the BMC.
@@ -200,19 +286,18 @@ static int bmc_run(const char *bmc_cmd)
  */
 static int bmc_read_int(const char *bmc_cmd, int base, int *result)
 {
-    char shell_cmd[512];
     char line[128];
     char *end;
     long val;
     FILE *fp;
+    pid_t pid;
 
-    build_ssh_cmd(shell_cmd, sizeof(shell_cmd), bmc_cmd, " 2>/dev/null");
-    fp = popen(shell_cmd, "r");
+    fp = ssh_popen(bmc_cmd, &pid);
     if (!fp) return -1;
 
     line[0] = '\0';
     fgets(line, sizeof(line), fp);
-    pclose(fp);
+    ssh_pclose(fp, pid);
 
     line[strcspn(line, "\r\n")] = '\0';   /* strip newline */
     if (!line[0]) return -1;
@@ -225,6 +310,52 @@ static int bmc_read_int(const char *bmc_cmd, int base, int *result)
     return 0;
 }
 
+/* ── bmc_read_ints ───────────────────────────────────────────────────────── */
+/**
+ * @brief Run a BMC command that prints n lines and parse each as an integer.
+ *
+ * Batched counterpart of bmc_read_int(): one SSH round-trip returns several
+ * values.  The command must print exactly one line per value, in order; a
+ * line that is empty or does not parse marks only that value as failed.
+ *
+ * @param bmc_cmd Shell command to run on the BMC.
+ * @param base    Numeric base for strtol() (see bmc_read_int()).
+ * @param vals    Out-array of n parsed integers.
+ * @param ok      Out-array of n flags: 1 if vals[i] is valid, 0 otherwise.
+ * @param n       Number of lines/values expected.
+ * @return Number of values parsed successfully, or -1 if ssh could not
+ *         be started.
+ */
+static int bmc_read_ints(const char *bmc_cmd, int base,
+                         int *vals, int *ok, int n)
+{
+    char line[128];
+    char *end;
+    long val;
+    FILE *fp;
+    pid_t pid;
+    int i, got = 0;
+
+    fp = ssh_popen(bmc_cmd, &pid);
+    if (!fp) return -1;
+
+    for (i = 0; i < n; i++) {
+        ok[i] = 0;
+        if (!fgets(line, sizeof(line), fp))
+            continue;
+        line[strcspn(line, "\r\n")] = '\0';
+        if (!line[0]) continue;
+        errno = 0;
+        val   = strtol(line, &end, base);
+        if (end == line || errno != 0) continue;
+        vals[i] = (int)val;
+        ok[i]   = 1;
+        got++;
+    }
+    ssh_pclose(fp, pid);
+    return got;
+}
+
 /* ── bmc_read_pmbus_string ──────────────────────────────────────────────── */
 /**
  * @brief Read a PMBus block-read register via i2cdump and decode as ASCII.
@@ -252,27 +383,26 @@ static int bmc_read_pmbus_string(int bus, int addr, int reg,
                                  char *out, size_t outsz)
 {
     char bmc_cmd[256];
-    char shell_cmd[512];
     char line[512];
     FILE *fp;
+    pid_t pid;
     char *ascii;
     int end;
 
     snprintf(bmc_cmd, sizeof(bmc_cmd),
              "i2cdump -f -y %d 0x%02x s 0x%02x",
              bus, addr, reg);
-    build_ssh_cmd(shell_cmd, sizeof(shell_cmd), bmc_cmd, " 2>/dev/null");
 
-    fp = popen(shell_cmd, "r");
+    fp = ssh_popen(bmc_cmd, &pid);
     if (!fp) return -1;
 
     /* Skip the header line ("     0  1  2 ...") */
-    if (!fgets(line, sizeof(line), fp)) { pclose(fp); return -1; }
+    if (!fgets(line, sizeof(line), fp)) { ssh_pclose(fp, pid); return -1; }
 
     /* Read the data line ("00: 53 50 41 ...    SPAFCBK-14G") */
     line[0] = '\0';
     fgets(line, sizeof(line), fp);
-    pclose(fp);
+    ssh_pclose(fp, pid);
 
     line[strcspn(line, "\r\n")] = '\0';
     if (!line[0]) return -1;
@@ -627,12 +757,27 @@ int main(void)
                     write_file(path, val);
             }
 
-            /* thermal sensors */
-            for (i = 0; i < 7; i++) {
-                snprintf(cmd,  sizeof(cmd),  "cat %s", thermal_paths[i]);
-                snprintf(path, sizeof(path), RUN_DIR "/thermal_%d", i + 1);
-                if (bmc_read_int(cmd, 10, &val) == 0)
-                    write_file(path, val);
+            /*
+             * thermal sensors — all 7 in one SSH round-trip.  "echo $(cat)"
+             * emits exactly one line per sensor: empty if the path is
+             * missing, first value first if the hwmon glob matches twice.
+             */
+            {
+                int tvals[7], tok[7];
+                size_t len = 0;
+
+                cmd[0] = '\0';
+                for (i = 0; i < 7 && len < sizeof(cmd); i++)
+                    len += snprintf(cmd + len, sizeof(cmd) - len,
+                                    "echo $(cat %s);", thermal_paths[i]);
+                if (bmc_read_ints(cmd, 10, tvals, tok, 7) > 0) {
+                    for (i = 0; i < 7; i++) {
+                        if (!tok[i]) continue;
+                        snprintf(path, sizeof(path),
+                                 RUN_DIR "/thermal_%d", i + 1);
+                        write_file(path, tvals[i]);
+                    }
+                }
             }
 
             /* fan-tray presence */
@@ -682,18 +827,32 @@ int main(void)
                     continue;
                 }
 
-                snprintf(cmd, sizeof(cmd), "i2cset -f -y 7 0x70 0x%02x",
-                         psu_cfg[i].mux_ch);
-                bmc_run(cmd);
-
-                for (r2 = 0; r2 < 7; r2++) {
-                    snprintf(cmd, sizeof(cmd),
-                             "i2cget -f -y 7 0x%02x 0x%02x w",
-                             psu_cfg[i].pmbus_addr, pmbus_regs[r2].reg);
-                    snprintf(path, sizeof(path), RUN_DIR "/psu_%d_%s",
-                             i + 1, pmbus_regs[r2].name);
-                    if (bmc_read_int(cmd, 0, &val) == 0)
-                        write_file(path, val);
+                /*
+                 * Mux select + all 7 word reads in one SSH round-trip.
+                 * "|| echo" keeps one output line per register so a
+                 * failed i2cget does not shift the values that follow.
+                 */
+                {
+                    int vals[7], ok[7];
+                    size_t len;
+
+                    len = snprintf(cmd, sizeof(cmd),
+                                   "i2cset -f -y 7 0x70 0x%02x >/dev/null;",
+                                   psu_cfg[i].mux_ch);
+                    for (r2 = 0; r2 < 7 && len < sizeof(cmd); r2++)
+                        len += snprintf(cmd + len, sizeof(cmd) - len,
+                                        " i2cget -f -y 7 0x%02x 0x%02x w || echo;",
+                                        psu_cfg[i].pmbus_addr,
+                                        pmbus_regs[r2].reg);
+
+                    if (bmc_read_ints(cmd, 0, vals, ok, 7) > 0) {
+                        for (r2 = 0; r2 < 7; r2++) {
+                            if (!ok[r2]) continue;
+                            snprintf(path, sizeof(path), RUN_DIR "/psu_%d_%s",
+                                     i + 1, pmbus_regs[r2].name);
+                            write_file(path, vals[r2]);
+                        }
+                    }
                 }
 
                 /* PSU model/serial: read once per insertion (block-read) */
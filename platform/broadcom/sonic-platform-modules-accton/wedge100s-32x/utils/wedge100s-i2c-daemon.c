@@ -489,6 +489,48 @@ static int i2c_read_byte_data(int bus, int addr, int reg)
     return (int)(data.byte & 0xFF);
 }
 
+/**
+ * @brief Read a 16-bit word from an I2C device via SMBus ioctl (Phase 1 fallback).
+ *
+ * Same as i2c_read_byte_data() but issues I2C_SMBUS_WORD_DATA.  On PCA9535
+ * a word read at INPUT0 returns INPUT0 in the low byte and INPUT1 in the
+ * high byte (the register pointer auto-increments within the pair).
+ *
+ * @param bus  Linux I2C bus number (N in /dev/i2c-N).
+ * @param addr 7-bit I2C device address.
+ * @param reg  Register offset of the low byte.
+ * @return Word value [0..65535] on success, -1 on open/ioctl failure.
+ */
+static int i2c_read_word_data(int bus, int addr, int reg)
+{
+    char devpath[32];
+    int fd;
+    union i2c_smbus_data data;
+    struct i2c_smbus_ioctl_data args;
+
+    snprintf(devpath, sizeof(devpath), "/dev/i2c-%d", bus);
+    fd = open(devpath, O_RDWR);
+    if (fd < 0) return -1;
+
+    if (ioctl(fd, I2C_SLAVE_FORCE, addr) < 0) {
+        close(fd);
+        return -1;
+    }
+
+    args.read_write = I2C_SMBUS_READ;
+    args.command    = (unsigned char)reg;
+    args.size       = I2C_SMBUS_WORD_DATA;
+    args.data       = &data;
+
+    if (ioctl(fd, I2C_SMBUS, &args) < 0) {
+        close(fd);
+        return -1;
+    }
+
+    close(fd);
+    return (int)(data.word & 0xFFFF);
+}
+
 /**
  * @brief Write a single byte to an I2C device via SMBus ioctl (Phase 1 fallback).
  *
@@ -555,20 +597,73 @@ static int write_str_file(const char *path, const char *str)
 }
 
 /**
- * @brief Write binary data to a file, creating or truncating it.
+ * @brief Atomically replace a file with binary data.
+ *
+ * Writes to a mkstemp() file beside path and rename()s it over path, so
+ * readers see either the previous complete file or the new one — never a
+ * truncated EEPROM image that still carries a valid magic.  The temp name
+ * is unique because sfp.py's DOM merge also replaces sfp_N_eeprom.  Used
+ * for the EEPROM caches (syseeprom, sfp_N_eeprom).
  *
  * @param path Absolute path of the file.
  * @param buf  Data to write.
  * @param len  Number of bytes to write.
- * @return 0 on success, -1 if fopen() failed or fewer than len bytes were written.
+ * @return 0 on success, -1 on any open/write/close/rename failure (errno set).
  */
 static int write_binary_file(const char *path, const unsigned char *buf, int len)
 {
-    FILE *f = fopen(path, "wb");
-    if (!f) return -1;
-    int written = (int)fwrite(buf, 1, (size_t)len, f);
-    fclose(f);
-    return (written == len) ? 0 : -1;
+    char tmp[PATH_MAX];
+    if (snprintf(tmp, sizeof(tmp), "%s.XXXXXX", path) >= (int)sizeof(tmp)) {
+        errno = ENAMETOOLONG;
+        return -1;
+    }
+    int fd = mkstemp(tmp);
+    if (fd < 0) return -1;
+    int written = 0;
+    while (written < len) {
+        ssize_t n = write(fd, buf + written, (size_t)(len - written));
+        if (n < 0) {
+            if (errno == EINTR) continue;
+            break;
+        }
+        written += (int)n;
+    }
+    /* mkstemp() creates 0600; keep the caches world-readable like before. */
+    if (written != len || fchmod(fd, 0644) != 0) {
+        int saved = errno;
+        close(fd);
+        unlink(tmp);
+        errno = saved;
+        return -1;
+    }
+    if (close(fd) != 0 || rename(tmp, path) != 0) {
+        int saved = errno;
+        unlink(tmp);
+        errno = saved;
+        return -1;
+    }
+    return 0;
+}
+
+/**
+ * @brief Write the 32-port presence bitmap to RUN_DIR/sfp_present_mask.
+ *
+ * Single "0x%08x" line; bit N set = port N present.  Lets chassis.py
+ * collect all 32 ports with one open() instead of 32 sfp_N_present reads.
+ * Written after the per-port files so both views agree once it lands.
+ *
+ * @param present Per-port presence array (NUM_PORTS entries, non-zero = present).
+ */
+static void write_presence_mask(const int *present)
+{
+    uint32_t mask = 0;
+    char buf[16];
+
+    for (int p = 0; p < NUM_PORTS; p++)
+        if (present[p])
+            mask |= 1u << p;
+    snprintf(buf, sizeof(buf), "0x%08x", mask);
+    write_str_file(RUN_DIR "/sfp_present_mask", buf);
 }
 
 /* ── EEPROM refresh helper ───────────────────────────────────────────────── */
@@ -1434,25 +1529,24 @@ static void poll_presence_hidraw(void)
             pca9535_failures++;
             continue;
         }
-        for (int r = 0; r < 2; r++) {
-            uint8_t reg_byte = (uint8_t)r;
-            uint8_t val = 0;
-            int ret = cp2112_write_read((uint8_t)PCA9535_ADDR[g],
-                                        &reg_byte, 1, &val, 1);
-            if (ret < 0) {
-                fprintf(stderr,
-                        "wedge100s-i2c-daemon: PCA9535[%d] reg %d read failed\n",
-                        g, r);
-                pca9535_failures++;
-                continue;
-            }
-            for (int bit = 0; bit < 8; bit++) {
-                int line = r * 8 + bit;
-                int p    = g * 16 + (line ^ 1);  /* XOR-1 interleave (ONL sfpi.c) */
-                curr_present[p] = !((val >> bit) & 1);  /* active-low */
-            }
-        }
+        /* INPUT0 and INPUT1 in one transfer: the PCA9535 register pointer
+         * auto-increments from 0 to 1. */
+        uint8_t reg_byte = 0;
+        uint8_t val[2] = {0, 0};
+        int ret = cp2112_write_read((uint8_t)PCA9535_ADDR[g],
+                                    &reg_byte, 1, val, 2);
         mux_deselect(0x74);
+        if (ret < 0) {
+            fprintf(stderr,
+                    "wedge100s-i2c-daemon: PCA9535[%d] INPUT0/1 read failed\n",
+                    g);
+            pca9535_failures++;
+            continue;
+        }
+        for (int line = 0; line < 16; line++) {
+            int p = g * 16 + (line ^ 1);  /* XOR-1 interleave (ONL sfpi.c) */
+            curr_present[p] = !((val[line >> 3] >> (line & 7)) & 1);  /* active-low */
+        }
     }
 
     /*
@@ -1460,7 +1554,7 @@ static void poll_presence_hidraw(void)
      * Trigger a CPLD I2C flush via BMC and cancel the stale CP2112 transfer.
      * The next poll tick will retry presence reads naturally.
      */
-    if (pca9535_failures >= 4) {
+    if (pca9535_failures >= 2) {
         cpld_i2c_flush();
         cp2112_cancel();
         return;
@@ -1506,6 +1600,8 @@ static void poll_presence_hidraw(void)
 
         write_str_file(present_path, "1");
     }
+
+    write_presence_mask(curr_present);
 }
 
 /* ── poll_rxloss — hidraw path (Phase 2 only) ─────────────────────────── */
@@ -1583,22 +1679,19 @@ static void poll_presence(void)
 
     memset(curr_present, 0, sizeof(curr_present));
 
-    /* Read all 4 PCA9535 INPUT registers (2 chips × 2 registers) */
+    /* Read both PCA9535 INPUT registers per chip as one SMBus word */
     for (int g = 0; g < 2; g++) {
-        for (int r = 0; r < 2; r++) {
-            int byte = i2c_read_byte_data(PCA9535_BUS[g], PCA9535_ADDR[g], r);
-            if (byte < 0) {
-                fprintf(stderr,
-                        "wedge100s-i2c-daemon: PCA9535 read failed "
-                        "(bus %d addr 0x%02x reg %d): %s\n",
-                        PCA9535_BUS[g], PCA9535_ADDR[g], r, strerror(errno));
-                continue;
-            }
-            for (int bit = 0; bit < 8; bit++) {
-                int line = r * 8 + bit;
-                int p    = g * 16 + (line ^ 1);
-                curr_present[p] = !((byte >> bit) & 1);
-            }
+        int word = i2c_read_word_data(PCA9535_BUS[g], PCA9535_ADDR[g], 0);
+        if (word < 0) {
+            fprintf(stderr,
+                    "wedge100s-i2c-daemon: PCA9535 read failed "
+                    "(bus %d addr 0x%02x): %s\n",
+                    PCA9535_BUS[g], PCA9535_ADDR[g], strerror(errno));
+            continue;
+        }
+        for (int line = 0; line < 16; line++) {
+            int p = g * 16 + (line ^ 1);
+            curr_present[p] = !((word >> line) & 1);
         }
     }
 
@@ -1658,6 +1751,8 @@ static void poll_presence(void)
 
         write_str_file(present_path, "1");
     }
+
+    write_presence_mask(curr_present);
 }
 
 /* ── persistent daemon helpers ──────────────────────────────────────────── */
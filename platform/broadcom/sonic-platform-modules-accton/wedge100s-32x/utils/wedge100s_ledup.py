@@ -322,6 +322,11 @@ CPLD_ALL_OFF = 0x00             # everything disabled
 BMC_KEY = "/etc/sonic/wedge100s-bmc-key"
 BMC_HOST = "root@fe80::ff:fe00:1%usb0"
 RUN_DIR = "/run/wedge100s"
+# Shared with sonic_platform.bmc: reusing its master connection turns each
+# register access into a channel open on an existing session instead of a
+# full SSH handshake.
+BMC_SSH_CONTROL_PATH = RUN_DIR + "/bmc-ssh.ctl"
+BMC_SSH_CONTROL_PERSIST = 300
 
 
 class CpldAccess:
@@ -341,6 +346,9 @@ class CpldAccess:
         cmd = [
             "ssh", "-o", "StrictHostKeyChecking=no", "-o", "BatchMode=yes",
             "-o", "ConnectTimeout=5", "-i", self._bmc_key,
+            "-o", "ControlMaster=auto",
+            "-o", "ControlPath=" + BMC_SSH_CONTROL_PATH,
+            "-o", "ControlPersist=%d" % BMC_SSH_CONTROL_PERSIST,
             self._bmc_host, bmc_command,
         ]
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=15)